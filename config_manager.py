@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import configparser
 import logging
+import os
 from pathlib import Path
-from typing import Dict, Mapping
+from typing import Dict, Mapping, Optional, Tuple
 
 from slot_ledger import default_slot_ledger_db_path
 
@@ -118,6 +119,9 @@ class ConfigManager:
     def __init__(self, config_path: str = "config.ini", template_path: str = "config.ini.template") -> None:
         self.config_path = Path(config_path)
         self.template_path = Path(template_path)
+        # ui_values() cache keyed on the config file's (mtime_ns, size) so
+        # every dashboard GET does not re-stat + re-tokenize the INI file.
+        self._ui_cache: Optional[Tuple[Tuple[int, int], Dict[str, str]]] = None
 
     def load_parser(self) -> configparser.ConfigParser:
         parser = configparser.ConfigParser()
@@ -177,8 +181,20 @@ class ConfigManager:
         return changed
 
     def save_parser(self, parser: configparser.ConfigParser) -> None:
-        with self.config_path.open("w", encoding="utf-8") as handle:
+        # Atomic tmp + rename: a reader (checker hot-reload, another UI
+        # request) never observes a partially written config.
+        tmp_path = self.config_path.with_suffix(self.config_path.suffix + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as handle:
             parser.write(handle)
+        os.replace(tmp_path, self.config_path)
+        self._ui_cache = None
+
+    def _config_stat_key(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.config_path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
 
     @staticmethod
     def get_case_insensitive(parser: configparser.ConfigParser, key: str, fallback: str = "") -> str:
@@ -199,15 +215,32 @@ class ConfigManager:
                 return
         section[key.lower()] = value
 
-    def save_updates(self, updates: Mapping[str, str]) -> None:
+    def save_updates(self, updates: Mapping[str, str]) -> bool:
+        """Apply updates and persist them; return False on a no-op save."""
         parser = self.load_parser()
+        changed = False
         for key, value in updates.items():
-            self.set_case_insensitive(parser, key, value)
-        self.save_parser(parser)
+            if self.get_case_insensitive(parser, key, "") != str(value):
+                self.set_case_insensitive(parser, key, value)
+                changed = True
+        if changed:
+            self.save_parser(parser)
+        return changed
 
     def ui_values(self) -> Dict[str, str]:
+        stat_key = self._config_stat_key()
+        cached = self._ui_cache
+        if stat_key is not None and cached is not None and cached[0] == stat_key:
+            # Hand out a copy so callers can mutate their view freely.
+            return dict(cached[1])
+
         parser = self.load_parser()
         current: Dict[str, str] = {}
         for key in CONFIG_KEYS:
             current[key] = self.get_case_insensitive(parser, key, DEFAULTS.get(key, ""))
+
+        # Re-stat after load_parser, which may have created or migrated the file.
+        stat_key = self._config_stat_key()
+        if stat_key is not None:
+            self._ui_cache = (stat_key, dict(current))
         return current
\ No newline at end of file
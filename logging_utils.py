@@ -1,7 +1,10 @@
+import atexit
 import json
 import logging
+import queue
+import sys
 from datetime import datetime, timezone
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 LOG_DIR = Path("logs")
@@ -21,6 +24,18 @@ NOISY_LOGGERS = [
 ]
 
 
+# Background listener draining the log queue; emitters only enqueue, so the
+# check loop never blocks on a file/console write.
+_LOG_LISTENER: QueueListener | None = None
+
+
+def _stop_log_listener() -> None:
+    global _LOG_LISTENER
+    if _LOG_LISTENER is not None:
+        _LOG_LISTENER.stop()
+        _LOG_LISTENER = None
+
+
 class JsonLogFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         payload = {
@@ -35,6 +50,10 @@ class JsonLogFormatter(logging.Formatter):
 def configure_logging(*, debug: bool = False, json_logs: bool = False) -> None:
     level = logging.DEBUG if debug else logging.INFO
     stream_handler = logging.StreamHandler()
+    if not sys.stderr.isatty():
+        # Non-interactive run (systemd/pipe): keep console output to WARNING+
+        # so per-check INFO chatter is formatted only for the rotating file.
+        stream_handler.setLevel(logging.WARNING)
     file_handler: logging.Handler
     log_path = LOG_PATH
 
@@ -63,7 +82,16 @@ def configure_logging(*, debug: bool = False, json_logs: bool = False) -> None:
     for handler in handlers:
         handler.setFormatter(formatter)
 
-    logging.basicConfig(level=level, handlers=handlers, force=True)
+    # Route all records through a queue so disk/console writes happen on a
+    # single background thread instead of inside the hot path.
+    _stop_log_listener()
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    global _LOG_LISTENER
+    _LOG_LISTENER = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _LOG_LISTENER.start()
+    atexit.register(_stop_log_listener)
+
+    logging.basicConfig(level=level, handlers=[QueueHandler(log_queue)], force=True)
 
     for noisy_logger in NOISY_LOGGERS:
         logging.getLogger(noisy_logger).setLevel(logging.WARNING)
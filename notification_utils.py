@@ -1,11 +1,64 @@
 import json
 import logging
 import smtplib
+import threading
 import urllib.error
 import urllib.parse
 import urllib.request
 from email.mime.text import MIMEText
 
+# Opening a fresh TCP + STARTTLS + login handshake per email costs several
+# network round-trips; cache one authenticated connection and revalidate it
+# with NOOP before reuse.
+_SMTP_LOCK = threading.Lock()
+_SMTP_CACHE = {"conn": None, "key": None}
+
+
+def _drop_smtp_connection() -> None:
+    conn = _SMTP_CACHE["conn"]
+    _SMTP_CACHE["conn"] = None
+    _SMTP_CACHE["key"] = None
+    if conn is not None:
+        try:
+            conn.quit()
+        except Exception:  # noqa: BLE001
+            pass
+
+
+def close_cached_smtp_connection() -> None:
+    """Politely quit the cached SMTP connection (e.g. at process shutdown)."""
+    with _SMTP_LOCK:
+        _drop_smtp_connection()
+
+
+def _get_smtp_connection(cfg):
+    """Return a cached authenticated SMTP connection, reconnecting if stale."""
+    key = (cfg.smtp_server, cfg.smtp_port, cfg.smtp_user)
+    conn = _SMTP_CACHE["conn"]
+    if conn is not None and _SMTP_CACHE["key"] == key:
+        try:
+            if conn.noop()[0] == 250:
+                return conn
+        except Exception:  # noqa: BLE001
+            pass
+        _drop_smtp_connection()
+
+    conn = smtplib.SMTP(cfg.smtp_server, cfg.smtp_port)
+    try:
+        conn.starttls()
+        conn.login(cfg.smtp_user, cfg.smtp_pass)
+    except Exception:
+        # A failed handshake leaves a half-open socket that would never be
+        # cached (and so never closed); tear it down before surfacing.
+        try:
+            conn.close()
+        except Exception:  # noqa: BLE001
+            pass
+        raise
+    _SMTP_CACHE["conn"] = conn
+    _SMTP_CACHE["key"] = key
+    return conn
+
 
 def send_notification(cfg, subject: str, message: str) -> bool:
     if not cfg.is_smtp_configured():
@@ -18,10 +71,15 @@ def send_notification(cfg, subject: str, message: str) -> bool:
         msg["From"] = cfg.smtp_user
         msg["To"] = cfg.notify_email
 
-        with smtplib.SMTP(cfg.smtp_server, cfg.smtp_port) as server:
-            server.starttls()
-            server.login(cfg.smtp_user, cfg.smtp_pass)
-            server.sendmail(cfg.smtp_user, cfg.notify_email, msg.as_string())
+        with _SMTP_LOCK:
+            server = _get_smtp_connection(cfg)
+            try:
+                server.sendmail(cfg.smtp_user, cfg.notify_email, msg.as_string())
+            except (smtplib.SMTPServerDisconnected, smtplib.SMTPResponseException):
+                # Server closed the idle connection; retry once on a fresh one.
+                _drop_smtp_connection()
+                server = _get_smtp_connection(cfg)
+                server.sendmail(cfg.smtp_user, cfg.notify_email, msg.as_string())
 
         logging.info("Email notification sent successfully")
         return True
@@ -33,8 +91,12 @@ def send_notification(cfg, subject: str, message: str) -> bool:
         logging.error(
             guidance
         )
+        with _SMTP_LOCK:
+            _drop_smtp_connection()
     except Exception as exc:  # noqa: BLE001
         logging.exception("Failed to send email notification: %s", exc)
+        with _SMTP_LOCK:
+            _drop_smtp_connection()
 
     return False
 
@@ -12,6 +12,7 @@ def compute_sleep_seconds(
     sleep_jitter_seconds: int,
     is_prime_time: bool,
     backoff_until: Optional[datetime],
+    elapsed_seconds: float = 0.0,
 ) -> Tuple[int, Optional[datetime]]:
     if optimal_minutes < base_minutes:
         adjusted_minutes = optimal_minutes
@@ -26,7 +27,10 @@ def compute_sleep_seconds(
         jitter = random.randint(-sleep_jitter_seconds, sleep_jitter_seconds)
 
     min_sleep = 15 if is_prime_time else 30
-    sleep_seconds = max(min_sleep, base_seconds + jitter)
+    # Credit the previous check's wall time so checks are anchored to when the
+    # last one started, not when it finished (a 40s check no longer stretches
+    # the effective interval by 40s).
+    sleep_seconds = max(min_sleep, base_seconds + jitter - int(elapsed_seconds))
 
     if backoff_until:
         now = datetime.now()
@@ -0,0 +1,10 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_chrome_profile(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    """Point build_chrome_options at a throwaway profile dir.
+
+    Keeps tests from referencing the real ~/.visa_checker_chrome default.
+    """
+    monkeypatch.setenv("CHECKER_PROFILE_DIR", str(tmp_path / "chrome-profile"))
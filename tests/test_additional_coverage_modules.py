@@ -334,3 +334,129 @@ def test_config_manager_ui_values_include_defaults(tmp_path: Path) -> None:
     values = manager.ui_values()
     assert values["COUNTRY_CODE"] == "en-ca"
     assert values["MAX_REQUESTS_PER_HOUR"] == "120"
+
+
+def test_compute_sleep_seconds_credits_elapsed_check_time(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(scheduling_utils.random, "randint", lambda a, b: 10)
+
+    # Base 3 minutes + 10s jitter, minus the 40s the check itself took.
+    sleep, backoff = scheduling_utils.compute_sleep_seconds(
+        base_minutes=3,
+        optimal_minutes=5.0,
+        dynamic_backoff_minutes=3,
+        sleep_jitter_seconds=30,
+        is_prime_time=False,
+        backoff_until=None,
+        elapsed_seconds=40.0,
+    )
+    assert sleep == 3 * 60 + 10 - 40
+    assert backoff is None
+
+    # A pathologically slow check cannot push the interval below the floor.
+    sleep_floor, _ = scheduling_utils.compute_sleep_seconds(
+        base_minutes=3,
+        optimal_minutes=5.0,
+        dynamic_backoff_minutes=3,
+        sleep_jitter_seconds=30,
+        is_prime_time=True,
+        backoff_until=None,
+        elapsed_seconds=10_000.0,
+    )
+    assert sleep_floor == 15
+
+    # No jitter configured means randint is never consulted.
+    monkeypatch.setattr(
+        scheduling_utils.random, "randint",
+        lambda a, b: pytest.fail("randint called with sleep_jitter_seconds=0"),
+    )
+    sleep_plain, _ = scheduling_utils.compute_sleep_seconds(
+        base_minutes=3,
+        optimal_minutes=5.0,
+        dynamic_backoff_minutes=3,
+        sleep_jitter_seconds=0,
+        is_prime_time=False,
+        backoff_until=None,
+    )
+    assert sleep_plain == 3 * 60
+
+
+def test_config_manager_save_updates_skips_noop_writes(tmp_path: Path) -> None:
+    import config_manager as root_config_manager
+
+    config_path = tmp_path / "config.ini"
+    manager = root_config_manager.ConfigManager(str(config_path), str(tmp_path / "missing-template.ini"))
+
+    assert manager.save_updates({"EMAIL": "user@example.com"}) is True
+
+    # Re-submitting identical values is a no-op: the value sticks and the
+    # caller (web UI flash message) is told nothing changed.
+    assert manager.save_updates({"EMAIL": "user@example.com"}) is False
+    parser = manager.load_parser()
+    assert root_config_manager.ConfigManager.get_case_insensitive(parser, "EMAIL") == "user@example.com"
+
+    assert manager.save_updates({"EMAIL": "other@example.com"}) is True
+
+
+def _smtp_cfg() -> SimpleNamespace:
+    return SimpleNamespace(
+        smtp_server="smtp.example.com",
+        smtp_port=587,
+        smtp_user="user@example.com",
+        smtp_pass="app-pass",
+        notify_email="notify@example.com",
+        is_smtp_configured=lambda: True,
+    )
+
+
+def test_smtp_connection_cache_reuses_live_connection(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(notification_utils, "_SMTP_CACHE", {"conn": None, "key": None})
+    cfg = _smtp_cfg()
+
+    connections = []
+
+    def _factory(*args, **kwargs):
+        conn = MagicMock()
+        conn.noop.return_value = (250, b"ok")
+        connections.append(conn)
+        return conn
+
+    monkeypatch.setattr(notification_utils.smtplib, "SMTP", _factory)
+
+    first = notification_utils._get_smtp_connection(cfg)
+    second = notification_utils._get_smtp_connection(cfg)
+    assert first is second
+    assert len(connections) == 1
+    first.starttls.assert_called_once()
+    first.login.assert_called_once_with(cfg.smtp_user, cfg.smtp_pass)
+
+    # A failed NOOP means the server dropped us: reconnect on a fresh socket.
+    first.noop.side_effect = smtplib.SMTPServerDisconnected("gone")
+    third = notification_utils._get_smtp_connection(cfg)
+    assert third is not first
+    assert len(connections) == 2
+
+    # Changing credentials must not reuse the old authenticated session.
+    other_cfg = _smtp_cfg()
+    other_cfg.smtp_user = "someone-else@example.com"
+    fourth = notification_utils._get_smtp_connection(other_cfg)
+    assert fourth is not third
+    assert len(connections) == 3
+
+    notification_utils.close_cached_smtp_connection()
+    assert notification_utils._SMTP_CACHE["conn"] is None
+
+
+def test_smtp_connection_closes_socket_on_handshake_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(notification_utils, "_SMTP_CACHE", {"conn": None, "key": None})
+    cfg = _smtp_cfg()
+
+    conn = MagicMock()
+    conn.login.side_effect = smtplib.SMTPAuthenticationError(535, b"bad auth")
+    monkeypatch.setattr(notification_utils.smtplib, "SMTP", lambda *a, **k: conn)
+
+    with pytest.raises(smtplib.SMTPAuthenticationError):
+        notification_utils._get_smtp_connection(cfg)
+
+    conn.close.assert_called_once()
+    assert notification_utils._SMTP_CACHE["conn"] is None
+    assert notification_utils._SMTP_CACHE["key"] is None
@@ -1093,9 +1093,10 @@ class TestSchedulingLimitWarning:
 
         mock_handle.assert_called_once_with(mock_driver)
 
-    def test_warning_record_capture_saves_warning_png(self):
+    def test_warning_record_capture_saves_warning_png(self, tmp_path):
         checker = self._make_checker()
         mock_driver = self._make_mock_driver("Scheduling Limit Warning | AIS")
+        mock_driver.get_screenshot_as_png.return_value = b"png-bytes"
         checker.driver = mock_driver
         checker._warning_capture_in_progress = False
         checker._last_warning_artifact_signature = None
@@ -1110,11 +1111,13 @@ class TestSchedulingLimitWarning:
             }
         )
 
-        checker._capture_warning_artifact_for_record(record)
+        with patch("visa_appointment_checker.ARTIFACTS_DIR", tmp_path):
+            checker._capture_warning_artifact_for_record(record)
 
-        mock_driver.save_screenshot.assert_called_once()
-        screenshot_path = mock_driver.save_screenshot.call_args[0][0]
-        assert "_warning_" in screenshot_path
+        mock_driver.get_screenshot_as_png.assert_called_once()
+        written = list(tmp_path.glob("*_warning_*.png"))
+        assert len(written) == 1
+        assert written[0].read_bytes() == b"png-bytes"
 
     # ------------------------------------------------------------------
     # Phase 1: Continue acknowledgment path (new tests)
@@ -1549,3 +1552,70 @@ class TestOsAwareUserAgent:
         ua_args = [a for a in opts.arguments if "--user-agent=" in a]
         assert len(ua_args) == 1
         assert custom_ua in ua_args[0]
+
+
+class TestErrorNotificationDebounce:
+    """Verify ``_handle_error`` debounces duplicate error emails."""
+
+    def _make_checker(self):
+        from visa_appointment_checker import VisaAppointmentChecker
+
+        cfg = _make_config()
+        with patch.object(VisaAppointmentChecker, "__init__", lambda self, *a, **k: None):
+            checker = VisaAppointmentChecker.__new__(VisaAppointmentChecker)
+        checker.cfg = cfg
+        checker.driver = None  # skips artifact capture
+        return checker
+
+    @patch("visa_appointment_checker.send_notification", return_value=True)
+    @patch("visa_appointment_checker.time")
+    def test_duplicate_error_suppressed_within_window(self, mock_time, mock_send):
+        checker = self._make_checker()
+
+        mock_time.monotonic.return_value = 1000.0
+        checker._handle_error(ValueError("something broke"))
+        assert mock_send.call_count == 1
+
+        # Same signature 10s later: suppressed.
+        mock_time.monotonic.return_value = 1010.0
+        checker._handle_error(ValueError("something broke"))
+        assert mock_send.call_count == 1
+
+        # A different error is its own signature and goes out immediately.
+        mock_time.monotonic.return_value = 1020.0
+        checker._handle_error(RuntimeError("something broke"))
+        assert mock_send.call_count == 2
+
+        # Once the window lapses the original error notifies again.
+        mock_time.monotonic.return_value = 1000.0 + checker._NOTIF_DEBOUNCE_SECONDS + 1
+        checker._handle_error(ValueError("something broke"))
+        assert mock_send.call_count == 3
+
+    @patch("visa_appointment_checker.send_notification", return_value=False)
+    @patch("visa_appointment_checker.time")
+    def test_failed_send_is_not_debounced(self, mock_time, mock_send):
+        checker = self._make_checker()
+
+        mock_time.monotonic.return_value = 1000.0
+        checker._handle_error(ValueError("boom"))
+        mock_time.monotonic.return_value = 1001.0
+        checker._handle_error(ValueError("boom"))
+        # The first attempt failed, so the second must still try to send.
+        assert mock_send.call_count == 2
+
+    @patch("visa_appointment_checker.send_notification", return_value=True)
+    @patch("visa_appointment_checker.time")
+    def test_cache_evicts_oldest_signature(self, mock_time, mock_send):
+        checker = self._make_checker()
+        limit = checker._NOTIF_CACHE_MAX_ENTRIES
+
+        mock_time.monotonic.return_value = 1000.0
+        for i in range(limit + 5):
+            checker._handle_error(ValueError(f"unique error {i}"))
+
+        assert len(checker._notif_cache) == limit
+        # Oldest signatures were evicted, so re-raising error 0 notifies again
+        # even though the debounce window has not lapsed.
+        sends_before = mock_send.call_count
+        checker._handle_error(ValueError("unique error 0"))
+        assert mock_send.call_count == sends_before + 1
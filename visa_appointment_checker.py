@@ -1,15 +1,23 @@
 import argparse
+import bisect
+import contextlib
+import functools
+import heapq
 import json
 import logging
+import math
 import os
 import random
 import re
+import shutil
 import smtplib
 import socket
 import sys
 import threading
 import time
 import tempfile
+import hashlib
+from collections import OrderedDict, deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
@@ -17,8 +25,9 @@ from email import encoders
 from email.mime.base import MIMEBase
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from io import BytesIO
 from pathlib import Path
-from typing import List, Optional, Tuple, Dict, Any
+from typing import Deque, List, Optional, Tuple, Dict, Any
 from urllib.parse import urljoin
 
 try:
@@ -41,12 +50,17 @@ from selenium.common.exceptions import (
     WebDriverException,
 )
 
+try:
+    from PIL import Image as _PILImage
+except ImportError:  # Pillow is optional; screenshots fall back to PNG without it
+    _PILImage = None  # type: ignore[assignment]
+
 from webdriver_manager.chrome import ChromeDriverManager
 from browser_session import build_chrome_options
 from config_wizard import run_cli_setup_wizard as run_cli_setup_wizard_external
 from config_manager import ConfigManager
 from logging_utils import LOG_PATH, ARTIFACTS_DIR, configure_logging
-from notification_utils import send_all_notifications
+from notification_utils import close_cached_smtp_connection, send_all_notifications
 from scheduling_utils import compute_sleep_seconds as compute_sleep_seconds_external
 from selector_registry import apply_selector_overrides
 from slot_ledger import SlotLedger, default_slot_ledger_db_path, initialize_slot_ledger_path
@@ -55,6 +69,37 @@ from vpn_utils import ProtonVpnManager
 # Keep webdriver-manager quiet unless user overrides
 os.environ.setdefault("WDM_LOG_LEVEL", "0")
 
+_CHROMEDRIVER_CACHE_FILE = ARTIFACTS_DIR / ".chromedriver_path"
+_CHROMEDRIVER_CACHE_TTL_SECONDS = 30 * 24 * 3600
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_chromedriver_path() -> str:
+    """Resolve the chromedriver binary without a network lookup per run.
+
+    ChromeDriverManager().install() performs an HTTP version check on every
+    call, which is pure startup latency when the checker is re-instantiated.
+    The resolved path is persisted under artifacts/ with a ~monthly TTL so
+    restarts reuse the binary while driver updates still land eventually.
+    """
+    try:
+        cache_stat = _CHROMEDRIVER_CACHE_FILE.stat()
+        if time.time() - cache_stat.st_mtime < _CHROMEDRIVER_CACHE_TTL_SECONDS:
+            cached = _CHROMEDRIVER_CACHE_FILE.read_text(encoding="utf-8").strip()
+            if cached and os.path.isfile(cached):
+                logging.debug("Using cached chromedriver path: %s", cached)
+                return cached
+    except OSError:
+        pass
+
+    path = ChromeDriverManager().install()
+    try:
+        _CHROMEDRIVER_CACHE_FILE.parent.mkdir(exist_ok=True)
+        _CHROMEDRIVER_CACHE_FILE.write_text(path, encoding="utf-8")
+    except OSError as exc:
+        logging.debug("Could not persist chromedriver path cache: %s", exc)
+    return path
+
 if sys.platform == "win32":
     try:
         import winsound  # type: ignore[import-not-found]
@@ -65,6 +110,80 @@ else:
 
 Selector = Tuple[str, str]
 
+# Phrases indicating a human-verification challenge. Compiled once so captcha
+# detection scans the raw page source in a single pass instead of allocating a
+# full lowercased copy of a potentially multi-MB string.
+_CHALLENGE_KEYWORDS = (
+    "verify you are human",
+    "i am not a robot",
+    "please select all",
+    "captcha challenge",
+    "complete the security check",
+)
+_CHALLENGE_RE = re.compile(
+    "|".join(re.escape(keyword) for keyword in _CHALLENGE_KEYWORDS),
+    re.IGNORECASE,
+)
+
+# Case-insensitive regex scans over the raw page source avoid the full-copy
+# .lower() pass on multi-MB AIS pages.
+_SCHEDULING_LIMIT_RE = re.compile("scheduling limit warning", re.IGNORECASE)
+_SCHEDULING_LIMIT_BLOCK_RE = re.compile(
+    "|".join(
+        re.escape(marker)
+        for marker in (
+            "scheduling limit warning",
+            "error message",
+            "please try again later",
+            "too many requests",
+        )
+    ),
+    re.IGNORECASE,
+)
+_SCHEDULING_LIMIT_PAGE_RE = re.compile(
+    "|".join(
+        re.escape(marker)
+        for marker in (
+            "scheduling limit warning",
+            "you have reached the maximum number of times",
+            "please click continue to proceed",
+            "maximum number of 3 cancellations/reschedules",
+            "you have 3 remaining attempt",
+        )
+    ),
+    re.IGNORECASE,
+)
+
+# Login/rate-limit phrases scanned on every handled error; compiled once so
+# each exception costs a single pass instead of three substring sweeps.
+_LOGIN_RATE_LIMIT_RE = re.compile(r"rate limiting|sign in or sign up|login blocked", re.IGNORECASE)
+
+# One alternation scan replaces the independent substring sweeps that
+# _capture_debug_state runs over the full page source for its indicators.
+_DEBUG_INDICATOR_RE = re.compile(
+    r"(?P<limit>scheduling limit warning)"
+    r"|(?P<login>user\[email\]|sign_in)"
+    r"|(?P<appt>consulate_appointment)"
+    r"|(?P<busy>not_available|no appointments)"
+    r"|(?P<captcha>captcha)"
+    r"|(?P<error>error)"
+    r"|(?P<alert>alert)",
+    re.IGNORECASE,
+)
+
+# Per-check console messages go through the logging pipeline (lazy %-args)
+# instead of unconditional f-string prints; emoji prefixes are kept only for
+# interactive terminals so journald/pipes never see non-ASCII decorations.
+_STDOUT_IS_TTY = sys.stdout.isatty()
+_EMOJI_PREFIX_RE = re.compile(r"^[^\x00-\x7F]+ ?")
+
+
+def _status(message: str, *args: object) -> None:
+    """Log a user-facing status line from the main loop."""
+    if not _STDOUT_IS_TTY:
+        message = _EMOJI_PREFIX_RE.sub("", message)
+    logging.info(message, *args)
+
 
 class WarningArtifactHandler(logging.Handler):
     """Capture a warning screenshot whenever a WARNING+ log record is emitted."""
@@ -100,7 +219,7 @@ def run_cli_setup_wizard(config_path: str = "config.ini", template_path: str = "
     run_cli_setup_wizard_external(config_path=config_path, template_path=template_path)
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckerConfig:
     email: str
     password: str
@@ -208,8 +327,10 @@ class CheckerConfig:
                 "Configuration missing required keys: " + ", ".join(sorted(missing))
             )
 
+        environ = os.environ  # hoisted: _get runs once per config field
+
         def _get(key: str, fallback: Optional[str] = None) -> str:
-            value = os.getenv(key, raw_defaults.get(key, fallback))
+            value = environ.get(key, raw_defaults.get(key, fallback))
             if value is None:
                 raise KeyError(f"Missing configuration value for {key}")
             return str(value).strip()
@@ -695,28 +816,16 @@ class VisaAppointmentChecker:
         (By.CSS_SELECTOR, "form input[type='email']"),
         (By.CSS_SELECTOR, "input[name*='email']"),
         (By.CSS_SELECTOR, "input[autocomplete='email']"),
-        (
-            By.XPATH,
-            "//input[contains(translate(@placeholder, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'email')]",
-        ),
-        (
-            By.XPATH,
-            "//input[contains(translate(@aria-label, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'email')]",
-        ),
+        # CSS4 case-insensitive attribute match replaces the translate()
+        # XPaths, which case-folded every candidate node per lookup.
+        (By.CSS_SELECTOR, "input[placeholder*='email' i], input[aria-label*='email' i]"),
     ]
 
     PASSWORD_SELECTORS: List[Selector] = [
         (By.ID, "user_password"),
         (By.NAME, "user[password]"),
         (By.CSS_SELECTOR, "form input[type='password']"),
-        (
-            By.XPATH,
-            "//input[contains(translate(@placeholder, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'password')]",
-        ),
-        (
-            By.XPATH,
-            "//input[contains(translate(@aria-label, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'password')]",
-        ),
+        (By.CSS_SELECTOR, "input[placeholder*='password' i], input[aria-label*='password' i]"),
     ]
 
     SIGN_IN_SELECTORS: List[Selector] = [
@@ -784,10 +893,7 @@ class VisaAppointmentChecker:
             By.XPATH,
             "//button[contains(translate(normalize-space(.), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'continue')]",
         ),
-        (
-            By.XPATH,
-            "//input[@type='submit' and contains(translate(@value, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'continue')]",
-        ),
+        (By.CSS_SELECTOR, "input[type='submit'][value*='continue' i]"),
     ]
 
     PRIVACY_CHECKBOX_SELECTORS: List[Selector] = [
@@ -799,10 +905,7 @@ class VisaAppointmentChecker:
             By.XPATH,
             "//input[@type='checkbox' and (contains(@name, 'policy') or contains(@id, 'policy'))]",
         ),
-        (
-            By.XPATH,
-            "//input[@type='checkbox' and contains(translate(@aria-label, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'privacy')]",
-        ),
+        (By.CSS_SELECTOR, "input[type='checkbox'][aria-label*='privacy' i]"),
     ]
 
     PRIVACY_LABEL_SELECTORS: List[Selector] = [
@@ -917,6 +1020,11 @@ class VisaAppointmentChecker:
     WARNING_BREAKER_STREAK_THRESHOLD: int = 3
     WARNING_BREAKER_COOLDOWN_MINUTES: int = 25
     WARNING_SCREENSHOT_MIN_INTERVAL_SECONDS: int = 90
+    HEARTBEAT_MIN_WRITE_INTERVAL_SECONDS: int = 30
+    ARTIFACT_LABEL_MIN_INTERVAL_SECONDS: int = 300
+    ARTIFACT_TOKEN_BUCKET_CAPACITY: int = 10
+    ARTIFACT_TOKEN_REFILL_SECONDS: float = 360.0
+    ARTIFACT_MIN_FREE_DISK_BYTES: int = 100 * 1024 * 1024
 
     # Selectors for the Continue acknowledgment button on the Scheduling Limit Warning page
     WARNING_CONTINUE_SELECTORS: List[Selector] = [
@@ -964,15 +1072,17 @@ class VisaAppointmentChecker:
         self.driver_path: Optional[str] = None
         # Try webdriver-manager first; if offline, fall back to Selenium Manager
         try:
-            self.driver_path = ChromeDriverManager().install()
+            self.driver_path = _resolve_chromedriver_path()
         except Exception as exc:
             logging.warning(
                 "webdriver-manager could not resolve driver (%s) — "
                 "falling back to Selenium Manager (built-in)",
                 exc,
             )
-        self._last_error_signature: Optional[str] = None
-        self._last_notification_time: Optional[datetime] = None
+        # Bounded LRU of error signatures → last-notified timestamp: a single
+        # remembered signature lets alternating errors (A,B,A,B…) bypass the
+        # 30-minute debounce and spam the SMTP account.
+        self._notif_cache: "OrderedDict[str, float]" = OrderedDict()  # signature -> monotonic send time
         self._appointment_base_url: Optional[str] = None
         self._backoff_until: Optional[datetime] = None
         self._checks_since_restart = 0
@@ -982,10 +1092,15 @@ class VisaAppointmentChecker:
         self._last_busy_check: Optional[datetime] = None
         self._busy_streak_count = 0
         self._adaptive_frequency = cfg.check_frequency_minutes
-        self._cached_elements = {}
+        self._last_check_duration = 0.0  # Wall time of the previous check (seconds)
+        self._prev_sleep = 0.0  # Feeds the decorrelated-jitter sleep stretch
         self._last_session_validation: Optional[datetime] = None
-        self._recent_results: List[int] = []  # Track last 10 check results
-        self._metrics: Dict[str, List[float]] = {}  # Performance metrics per operation
+        self._recent_results: Deque[int] = deque(maxlen=10)  # Track last 10 check results
+        self._recent_success_count = 0  # Running sum of _recent_results
+        self._metrics: Dict[str, Deque[float]] = {}  # Performance metrics per operation
+        self._metrics_ema: Dict[str, float] = {}  # O(1) exponential moving average per operation
+        self._metrics_extrema: Dict[str, Tuple[float, float]] = {}  # Running (min, max) since last stats log
+        self._metrics_counts: Dict[str, int] = {}  # Total samples ever seen per operation
         
         # Strategic optimization properties
         self._availability_history: List[Dict[str, Any]] = []
@@ -1003,6 +1118,22 @@ class VisaAppointmentChecker:
         self._rotation_index = 0
         self._vpn_manager: Optional[ProtonVpnManager] = None
 
+        # Single-worker pool so artifact disk writes happen off the main loop;
+        # the bounded pending counter drops captures instead of queueing
+        # unboundedly when writes fall behind.
+        self._artifact_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="artifact-writer")
+        self._artifact_pending = 0
+        self._artifact_pending_lock = threading.Lock()
+        self._artifact_last: Dict[str, float] = {}  # label -> monotonic time of last capture
+        # Global capture budget (token bucket) shared across labels.
+        self._artifact_tokens = float(self.ARTIFACT_TOKEN_BUCKET_CAPACITY)
+        self._artifact_refill = time.monotonic()
+        self._artifact_disk_warned = False
+
+        # Fire-and-forget notification delivery; SMTP/webhook round-trips can
+        # take seconds and should not stall the check loop.
+        self._notify_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="notifier")
+
         self._refresh_portal_urls()
 
         # API fast-path (P1.1 / P1.2)
@@ -1082,11 +1213,15 @@ class VisaAppointmentChecker:
             heartbeat_path = Path("logs") / "runtime_heartbeat.json"
         heartbeat_path.parent.mkdir(parents=True, exist_ok=True)
         self._heartbeat_path = heartbeat_path
+        self._last_heartbeat: Optional[Tuple[str, float]] = None
 
     # ------------------------------------------------------------------
     # Driver lifecycle helpers
     # ------------------------------------------------------------------
     def ensure_driver(self) -> webdriver.Chrome:
+        # Fast path is a plain attribute check — no health-check ping, no
+        # WebDriver round-trip — so helpers may call this freely; only truly
+        # tight loops bother hoisting the result into a local.
         if self.driver is not None:
             return self.driver
 
@@ -1101,6 +1236,7 @@ class VisaAppointmentChecker:
 
         driver.set_page_load_timeout(90)
         driver.implicitly_wait(0)
+        self._tune_command_channel(driver)
 
         try:
             driver.execute_cdp_cmd(
@@ -1123,10 +1259,140 @@ class VisaAppointmentChecker:
         except Exception:  # noqa: BLE001
             logging.debug("Unable to read driver capabilities for version logging")
 
+        self._apply_network_blocklist(driver)
+        self._prewarm_connection(driver)
+
         self.driver = driver
         logging.info("Chrome driver initialized (headless=%s)", self.headless)
+        self._restore_session_cookies(driver)
         return driver
 
+    # Resource patterns that never affect the DOM the checker reads:
+    # images, web fonts and third-party analytics. CSS is deliberately NOT
+    # blocked — visibility checks (getComputedStyle, is_displayed) depend on
+    # the real stylesheets.
+    _BLOCKED_URL_PATTERNS = [
+        "*.png",
+        "*.jpg",
+        "*.jpeg",
+        "*.gif",
+        "*.svg",
+        "*.ico",
+        "*.woff",
+        "*.woff2",
+        "*.ttf",
+        "*://*.google-analytics.com/*",
+        "*://*.googletagmanager.com/*",
+        "*://fonts.googleapis.com/*",
+        "*://fonts.gstatic.com/*",
+    ]
+
+    def _apply_network_blocklist(self, driver: webdriver.Chrome) -> None:
+        """Stop non-essential resource bytes at the protocol level.
+
+        --disable-images and the content-settings prefs only cover images the
+        renderer requests itself; CDP Network.setBlockedURLs also drops CDN
+        images, fonts and analytics before they are downloaded.
+        """
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self._BLOCKED_URL_PATTERNS})
+            logging.debug("Applied CDP network blocklist (%d patterns)", len(self._BLOCKED_URL_PATTERNS))
+        except Exception as exc:  # noqa: BLE001
+            logging.debug("Unable to apply CDP network blocklist: %s", exc)
+
+    def _prewarm_connection(self, driver: webdriver.Chrome) -> None:
+        """Open a TLS connection to the portal before the first real page load.
+
+        A fire-and-forget no-cors fetch pays the DNS + TCP + TLS handshake
+        while the driver is still idle, so the first LOGIN_URL get only costs
+        the request itself. robots.txt is used because it is tiny and not
+        caught by the resource blocklist.
+        """
+        try:
+            driver.execute_script(
+                "fetch(arguments[0] + '/robots.txt', {mode: 'no-cors'}).catch(() => {});",
+                self._portal_url().split("/en-", 1)[0],
+            )
+        except Exception as exc:  # noqa: BLE001
+            logging.debug("Connection pre-warm skipped: %s", exc)
+
+    def _persist_session_cookies(self, driver: webdriver.Chrome) -> None:
+        """Serialize session cookies so a process restart can skip the login."""
+        try:
+            cookies = driver.get_cookies()
+            path = ARTIFACTS_DIR / "session.json"
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(cookies), encoding="utf-8")
+            os.replace(tmp_path, path)
+            try:
+                os.chmod(path, 0o600)
+            except OSError:
+                pass
+            logging.debug("Persisted %d session cookies", len(cookies))
+        except Exception as exc:  # noqa: BLE001
+            logging.debug("Failed to persist session cookies: %s", exc)
+
+    def _restore_session_cookies(self, driver: webdriver.Chrome) -> bool:
+        """Load cookies persisted by a previous run into a fresh driver.
+
+        Returns True when at least one unexpired cookie was restored; the
+        regular session validation then decides whether login can be skipped.
+        """
+        path = ARTIFACTS_DIR / "session.json"
+        try:
+            cookies = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+        if not cookies:
+            return False
+
+        try:
+            # Cookies can only be attached once a page on the target domain is open.
+            driver.get(self._login_target())
+        except WebDriverException as exc:
+            logging.debug("Could not open portal to restore cookies: %s", exc)
+            return False
+
+        now_ts = datetime.now(timezone.utc).timestamp()
+        restored = 0
+        for cookie in cookies:
+            expiry = cookie.get("expiry")
+            if expiry is not None and expiry <= now_ts:
+                continue
+            try:
+                driver.add_cookie(cookie)
+                restored += 1
+            except WebDriverException:
+                continue
+
+        if restored:
+            logging.info("🔑 Restored %d session cookies from previous run", restored)
+            self._last_session_validation = datetime.now()
+        return bool(restored)
+
+    @staticmethod
+    def _tune_command_channel(driver: webdriver.Chrome) -> None:
+        """Widen the urllib3 pool behind the chromedriver command channel.
+
+        Every Selenium command is an HTTP call to chromedriver; the default
+        pool is small and does not disable Nagle, so bursts of findElement
+        calls can queue behind each other. Best-effort: the private pool
+        handle has moved between Selenium releases, so failures are ignored.
+        """
+        try:
+            pool = getattr(driver.command_executor, "_conn", None)
+            if pool is None:
+                return
+            pool.connection_pool_kw["maxsize"] = 8
+            pool.connection_pool_kw["socket_options"] = [
+                (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+            ]
+            pool.clear()
+            logging.debug("Tuned chromedriver command channel pool (maxsize=8, TCP_NODELAY)")
+        except Exception as exc:  # noqa: BLE001
+            logging.debug("Unable to tune chromedriver command channel: %s", exc)
+
     def reset_driver(self) -> None:
         self.quit_driver()
         self.driver = None
@@ -1146,10 +1412,35 @@ class VisaAppointmentChecker:
 
     def shutdown(self) -> None:
         """Release browser and logging hooks before process exit."""
+        self.wake_early()
         self._detach_warning_artifact_handler()
+        notify_pool = getattr(self, "_notify_pool", None)
+        if notify_pool is not None:
+            notify_pool.shutdown(wait=True)
+        artifact_pool = getattr(self, "_artifact_pool", None)
+        if artifact_pool is not None:
+            artifact_pool.shutdown(wait=True)
+        close_cached_smtp_connection()
         self._slot_ledger.shutdown()
         self.quit_driver()
 
+    def _notify_async(self, subject: str, message: str) -> None:
+        """Send a notification without blocking the check loop.
+
+        Delivery (SMTP, webhooks) can take seconds; availability alerts fired
+        mid-check go through the background notifier thread so the check
+        continues immediately. Falls back to a synchronous send when the pool
+        is unavailable or already shut down.
+        """
+        pool = getattr(self, "_notify_pool", None)
+        if pool is None:
+            send_notification(self.cfg, subject, message)
+            return
+        try:
+            pool.submit(send_notification, self.cfg, subject, message)
+        except RuntimeError:
+            send_notification(self.cfg, subject, message)
+
     def _attach_warning_artifact_handler(self) -> None:
         if self._warning_artifact_handler is not None:
             return
@@ -1189,6 +1480,23 @@ class VisaAppointmentChecker:
     def _login_target(self) -> str:
         return getattr(self, "_login_url", f"{self._portal_url()}/users/sign_in")
 
+    def _persist_base_url(self, base: str) -> None:
+        """Remember the captured appointment base URL across restarts."""
+        try:
+            (ARTIFACTS_DIR / "base_url.txt").write_text(base, encoding="utf-8")
+        except OSError as exc:
+            logging.debug("Could not persist appointment base URL: %s", exc)
+
+    def _load_persisted_base_url(self) -> Optional[str]:
+        try:
+            base = (ARTIFACTS_DIR / "base_url.txt").read_text(encoding="utf-8").strip()
+        except OSError:
+            return None
+        # Ignore URLs captured under a different portal/country configuration.
+        if base.startswith(self._portal_url()):
+            return base
+        return None
+
     def _reschedule_targets(self) -> List[str]:
         targets: List[str] = []
 
@@ -1196,6 +1504,16 @@ class VisaAppointmentChecker:
         if direct_url:
             targets.append(direct_url)
 
+        # Specialize to the known-good appointment URL captured from the
+        # group-continue flow (this run or a previous one) before trying the
+        # generic candidates — each stale guess can cost a full page-load
+        # timeout.
+        base_url = self._appointment_base_url or self._load_persisted_base_url()
+        if base_url:
+            known_url = urljoin(base_url, "appointment")
+            if known_url not in targets:
+                targets.append(known_url)
+
         configured = getattr(self, "_reschedule_urls", None)
         if isinstance(configured, list) and configured:
             for url in configured:
@@ -1508,22 +1826,25 @@ class VisaAppointmentChecker:
         Uses the configurable prime_time_backoff_multiplier (default 0.5 = 2x faster),
         weekend multiplier, and pattern-derived weight when available.
         """
-        base_freq = self.cfg.check_frequency_minutes
-        
+        cfg = self.cfg
+        base_freq = cfg.check_frequency_minutes
+
         # Apply pattern weight if pattern learning is active
         pattern_weight = self._calculate_pattern_weight()
-        
+
         if self._is_prime_time():
             # More frequent during optimal windows
-            freq = max(1.0, base_freq * self.cfg.prime_time_backoff_multiplier)
+            freq = max(1.0, base_freq * cfg.prime_time_backoff_multiplier)
             # Pattern weight further adjusts prime-time frequency
             freq = max(1.0, freq * pattern_weight)
             return freq
-        elif 2 <= self._now().hour <= 6:
+
+        now = self._now()
+        if 2 <= now.hour <= 6:
             # Less frequent during low-activity hours
             return base_freq * 2.0
-        elif self._now().weekday() in [5, 6]:  # Weekend
-            return base_freq * self.cfg.weekend_frequency_multiplier
+        elif now.weekday() in [5, 6]:  # Weekend
+            return base_freq * cfg.weekend_frequency_multiplier
         else:
             return base_freq * pattern_weight
 
@@ -2247,14 +2568,31 @@ class VisaAppointmentChecker:
 
         return results
 
+    def _parsed_target_dates(self) -> Optional[Tuple[datetime, datetime, datetime]]:
+        """Return (current, start, end) config dates parsed once and cached.
+
+        The cache key is the raw string triple, so a config mutation (e.g.
+        after a successful rebook updates the current date) re-parses
+        automatically while steady-state checks pay zero strptime calls.
+        """
+        raw = (self.cfg.current_appointment_date, self.cfg.start_date, self.cfg.end_date)
+        cached = getattr(self, "_target_dates_cache", None)
+        if cached is not None and cached[0] == raw:
+            return cached[1]
+        try:
+            parsed = tuple(datetime.strptime(value, "%Y-%m-%d") for value in raw)
+        except ValueError as exc:
+            logging.warning("Invalid date format in configuration: %s", exc)
+            return None
+        self._target_dates_cache = (raw, parsed)
+        return parsed
+
     def _evaluate_api_results(self, results: Dict[str, List[str]]) -> None:
         """Evaluate dates obtained from the API fast-path."""
-        try:
-            current_date = datetime.strptime(self.cfg.current_appointment_date, "%Y-%m-%d")
-            start_date = datetime.strptime(self.cfg.start_date, "%Y-%m-%d")
-            end_date = datetime.strptime(self.cfg.end_date, "%Y-%m-%d")
-        except ValueError:
+        parsed_dates = self._parsed_target_dates()
+        if parsed_dates is None:
             return
+        current_date, start_date, end_date = parsed_dates
 
         best_by_location: Dict[str, datetime] = {}
         api_check_id = int(getattr(self, "_api_check_count", 0) or 0)
@@ -2265,7 +2603,9 @@ class VisaAppointmentChecker:
             collector_latency = getattr(self, "_api_latency_ms_by_facility", {}).get(facility_id)
             for date_str in dates:
                 try:
-                    parsed = datetime.strptime(date_str, "%Y-%m-%d")
+                    # C-level ISO parser; strptime's format interpreter is an
+                    # order of magnitude slower per candidate date.
+                    parsed = datetime.fromisoformat(date_str)
                 except ValueError:
                     continue
 
@@ -2345,7 +2685,7 @@ class VisaAppointmentChecker:
             f"Range: {self.cfg.start_date} to {self.cfg.end_date}\n\n"
             + ("🤖 Auto-book ENABLED" if self.cfg.auto_book else "⚠️ Book manually: https://ais.usvisa-info.com")
         )
-        send_notification(self.cfg, subject, message)
+        self._notify_async(subject, message)
 
         self._slot_ledger.mark_notified(slot_key, best_location)
 
@@ -2485,25 +2825,40 @@ class VisaAppointmentChecker:
     # ------------------------------------------------------------------
     # High level flow
     # ------------------------------------------------------------------
+    # Computes the page-state bitmask in-browser so the (often multi-hundred-KB)
+    # page source never crosses the WebDriver channel; only an int comes back.
+    _PAGE_STATE_JS = """
+        const url = location.href.toLowerCase();
+        let mask = 0;
+        if (url.includes('appointment')) mask |= 1;
+        if (url.includes('schedule')) mask |= 2;
+        if (url.includes('groups')) mask |= 4;
+        if (url.includes('sign_in')) mask |= 8;
+        if (mask & 1) {
+            const html = ((document.documentElement && document.documentElement.innerHTML) || '').toLowerCase();
+            if (html.includes('form') || html.includes('appointments_consulate_appointment')) mask |= 16;
+        }
+        return mask;
+    """
+
     def _get_page_state(self) -> str:
         """Detect current page type to optimize navigation"""
         if not self.driver:
             return "no_driver"
-            
+
         try:
             if self._session_refresh_reason(self.driver):
                 return "login_required"
 
-            url = self.driver.current_url.lower()
-            page_source = self.driver.page_source.lower()
-            
-            if "appointment" in url and ("form" in page_source or "appointments_consulate_appointment" in page_source):
+            mask = int(self.driver.execute_script(self._PAGE_STATE_JS) or 0)
+
+            if mask & 16:
                 return "appointment_form"
-            elif "schedule" in url:
-                return "schedule_page" 
-            elif "groups" in url:
+            elif mask & 2:
+                return "schedule_page"
+            elif mask & 4:
                 return "dashboard"
-            elif "sign_in" in url:
+            elif mask & 8:
                 return "login_required"
             return "unknown"
         except Exception:
@@ -2528,7 +2883,7 @@ class VisaAppointmentChecker:
         )
 
     def perform_check(self) -> None:
-        start_time = datetime.now()
+        start_time = time.monotonic()
         self._start_check_cycle()
         
         # --- API fast-path (P1.1): skip browser if we have schedule_id ---
@@ -2616,8 +2971,7 @@ class VisaAppointmentChecker:
                 alt = self._check_all_locations()
                 if alt:
                     logging.info("Appointment availability detected at alternate location: %s", alt)
-                    send_notification(
-                        self.cfg,
+                    self._notify_async(
                         f"📍 Appointment available at {alt}!",
                         f"Calendar is open at {alt} while {self.cfg.location} is busy."
                         f"\n\nLogin to book: https://ais.usvisa-info.com",
@@ -2641,8 +2995,9 @@ class VisaAppointmentChecker:
             raise
         finally:
             self._finalize_check_cycle()
-            # Track performance metrics
-            duration = (datetime.now() - start_time).total_seconds()
+            # Track performance metrics (monotonic delta — immune to clock jumps)
+            duration = time.monotonic() - start_time
+            self._last_check_duration = duration
             self._track_performance('check_duration', duration)
 
     # ------------------------------------------------------------------
@@ -2714,6 +3069,7 @@ class VisaAppointmentChecker:
         self._detect_captcha()
 
         self._await_login_transition(driver)
+        self._persist_session_cookies(driver)
 
     def _navigate_to_schedule(self, driver: webdriver.Chrome) -> None:
         self._handle_group_continue()
@@ -2782,11 +3138,8 @@ class VisaAppointmentChecker:
         time.sleep(2)
         self._wait_for_page_ready(driver)
         
-        # Cache form elements when we reach the appointment page for future use
-        self._cache_form_elements()
-        
         # Try to find location selector with SHORTER wait to fail fast
-        location_select = self._find_element(self.LOCATION_SELECTORS, wait_time=10, use_cache=True)
+        location_select = self._find_element(self.LOCATION_SELECTORS, wait_time=10)
         if location_select:
             self._ensure_location_selected(location_select)
             logging.info("Location selector found and configured")
@@ -2806,12 +3159,12 @@ class VisaAppointmentChecker:
                 # avoid the 20-second widget wait in _check_consulate_availability and
                 # apply an appropriately long backoff.
                 try:
-                    title = (driver.title or "").lower()
-                    source = (driver.page_source or "").lower()
+                    title = driver.title or ""
+                    source = driver.page_source or ""
                 except Exception:  # noqa: BLE001
                     title = ""
                     source = ""
-                if "scheduling limit warning" in title or "scheduling limit warning" in source:
+                if _SCHEDULING_LIMIT_RE.search(title) or _SCHEDULING_LIMIT_RE.search(source):
                     self._handle_scheduling_limit_warning(driver)
 
     def _handle_group_continue(self) -> None:
@@ -2849,6 +3202,7 @@ class VisaAppointmentChecker:
                 base = f"{base}/"
             if base:
                 self._appointment_base_url = base
+                self._persist_base_url(base)
                 logging.debug("Captured appointment base URL: %s", self._appointment_base_url)
                 # Extract schedule_id for API fast-path
                 self._extract_schedule_id(base)
@@ -3071,13 +3425,21 @@ class VisaAppointmentChecker:
                     except NoSuchElementException:
                         pass
 
-            # Try fuzzy matching on visible text
-            for option in select.options:
-                option_text = option.text.strip()
+            # Try fuzzy matching on visible text. Pull every option label in
+            # one JS call and match locally — iterating select.options costs
+            # a .text round-trip per entry.
+            try:
+                option_texts = self.ensure_driver().execute_script(
+                    "return [...arguments[0].options].map(o => o.text);", element
+                ) or []
+            except WebDriverException:
+                option_texts = [option.text for option in select.options]
+            for index, raw_text in enumerate(option_texts):
+                option_text = (raw_text or "").strip()
                 if not option_text:
                     continue
                 if normalized_target in option_text.lower() or option_text.lower() in normalized_target:
-                    select.select_by_visible_text(option_text)
+                    select.select_by_index(index)
                     logging.info("Selected consular location using fuzzy match: %s", option_text)
                     time.sleep(0.5)  # Allow UI to update
                     return
@@ -3158,7 +3520,7 @@ class VisaAppointmentChecker:
 
     def _check_consulate_availability(self) -> None:
         driver = self.ensure_driver()
-        check_start = datetime.now()
+        check_start = time.monotonic()
         self._last_ui_check_latency_ms = None
         
         logging.debug("Starting consulate availability check at %s", driver.current_url)
@@ -3176,14 +3538,25 @@ class VisaAppointmentChecker:
             self._handle_scheduling_limit_warning(driver)
             return
 
-        try:
-            WebDriverWait(driver, 20).until(
-                lambda d: (
+        # Exponential poll backoff: start at 100ms so an instantly-rendered
+        # widget is caught right away, then stretch toward 2s so a page that
+        # is never going to load stops hammering chromedriver.
+        def _await_widgets(timeout: float = 20.0) -> bool:
+            deadline = time.monotonic() + timeout
+            interval = 0.1
+            while True:
+                if (
                     self._is_selector_visible(self.CONSULATE_BUSY_SELECTORS)
                     or self._is_selector_visible(self.CONSULATE_DATE_INPUT_SELECTORS)
-                )
-            )
-        except TimeoutException:
+                ):
+                    return True
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                time.sleep(min(interval, remaining))
+                interval = min(2.0, interval * 1.5)
+
+        if not _await_widgets():
             logging.warning("Consular appointment widgets did not load within the expected time window")
             # Capture comprehensive debug info when widgets don't load
             self._capture_debug_state("widgets_not_loaded")
@@ -3198,19 +3571,13 @@ class VisaAppointmentChecker:
             self._detect_captcha()
 
             try:
-                title = (driver.title or "").lower()
-                source = (driver.page_source or "").lower()
+                title = driver.title or ""
+                source = driver.page_source or ""
             except Exception:  # noqa: BLE001
                 title = ""
                 source = ""
 
-            scheduling_limit_markers = (
-                "scheduling limit warning",
-                "error message",
-                "please try again later",
-                "too many requests",
-            )
-            if any(marker in title or marker in source for marker in scheduling_limit_markers):
+            if _SCHEDULING_LIMIT_BLOCK_RE.search(title) or _SCHEDULING_LIMIT_BLOCK_RE.search(source):
                 self._handle_scheduling_limit_warning(driver)
             return
 
@@ -3267,9 +3634,8 @@ class VisaAppointmentChecker:
         else:
             # Calendar is accessible!
             if self._busy_streak_count > 5:  # Only alert if we've been seeing busy for a while
-                send_notification(
-                    self.cfg,
-                    "🚨 URGENT: Calendar Accessible!", 
+                self._notify_async(
+                    "🚨 URGENT: Calendar Accessible!",
                     f"Calendar is no longer busy after {self._busy_streak_count} attempts. Checking appointments NOW!"
                 )
             
@@ -3300,8 +3666,10 @@ class VisaAppointmentChecker:
         calendar_opened = False
         try:
             date_input.click()
-            time.sleep(0.3)
-            calendar_opened = self._is_selector_visible(self.DATEPICKER_CONTAINER_SELECTORS) is not None
+            calendar_opened = (
+                self._wait_condition(lambda d: self._is_selector_visible(self.DATEPICKER_CONTAINER_SELECTORS))
+                is not None
+            )
         except (WebDriverException, ElementNotInteractableException):
             logging.debug("Direct click on date input failed, trying alternatives")
 
@@ -3312,8 +3680,10 @@ class VisaAppointmentChecker:
                 if calendar_icon:
                     logging.debug("Attempting to open calendar via calendar icon")
                     calendar_icon.click()
-                    time.sleep(0.3)
-                    calendar_opened = self._is_selector_visible(self.DATEPICKER_CONTAINER_SELECTORS) is not None
+                    calendar_opened = (
+                        self._wait_condition(lambda d: self._is_selector_visible(self.DATEPICKER_CONTAINER_SELECTORS))
+                        is not None
+                    )
             except (WebDriverException, ElementNotInteractableException):
                 pass
 
@@ -3322,11 +3692,11 @@ class VisaAppointmentChecker:
             try:
                 logging.debug("Using JavaScript to trigger calendar")
                 driver.execute_script("arguments[0].focus(); arguments[0].click();", date_input)
-                time.sleep(0.3)
             except Exception as exc:
                 logging.warning("Failed to open calendar with all methods: %s", exc)
 
-        time.sleep(0.5)  # Allow calendar to fully render
+        # Exit the moment the widget is visible instead of a fixed render sleep.
+        self._wait_condition(lambda d: self._is_selector_visible(self.DATEPICKER_CONTAINER_SELECTORS))
 
         available_slots = self._collect_available_dates(max_months=3)
         if available_slots:
@@ -3338,54 +3708,126 @@ class VisaAppointmentChecker:
 
         time_select = self._find_element(self.CONSULATE_TIME_SELECTORS, wait_time=3)
         if time_select:
-            times = [
-                option.text.strip()
-                for option in Select(time_select).options
-                if option.get_attribute("value")
-            ]
+            # One batched fetch: per-option .text/get_attribute costs two
+            # round-trips per entry.
+            try:
+                times = driver.execute_script(
+                    "return [...arguments[0].options]"
+                    ".filter(o => o.getAttribute('value'))"
+                    ".map(o => o.text.trim());",
+                    time_select,
+                ) or []
+            except WebDriverException:
+                times = [
+                    option.text.strip()
+                    for option in Select(time_select).options
+                    if option.get_attribute("value")
+                ]
             if times:
                 logging.info("Available appointment times for selected date: %s", ", ".join(times))
             else:
                 logging.info("No appointment times loaded yet (date may not be selected or availability is empty)")
         
         # Track navigation performance
-        nav_time = (datetime.now() - check_start).total_seconds()
+        nav_time = time.monotonic() - check_start
         self._track_performance('availability_check', nav_time)
         self._last_ui_check_latency_ms = nav_time * 1000.0
 
+    # Collects one month of datepicker state in a single round-trip: the
+    # month title plus every selectable day, instead of one find_elements
+    # call and one .text fetch per day link.
+    _AVAILABLE_DAYS_JS = """
+        const cal = arguments[0];
+        const title = cal.querySelector('.ui-datepicker-title');
+        const days = [...cal.querySelectorAll('table.ui-datepicker-calendar td:not(.ui-state-disabled) a')]
+            .map(a => a.textContent.trim())
+            .filter(t => t.length > 0);
+        return {label: title ? title.textContent.trim() : '', days: days};
+    """
+
+    # Walks the whole calendar window in ONE async script: read a month,
+    # advance via an in-page MouseEvent on the next arrow, poll (50ms) for
+    # the title to change, repeat. The Python fallback below pays one click
+    # round-trip plus a fixed 500ms sleep per month instead.
+    _COLLECT_MONTHS_ASYNC_JS = """
+        const cal = arguments[0];
+        const maxMonths = arguments[1];
+        const done = arguments[arguments.length - 1];
+        const months = [];
+        function readMonth() {
+            const title = cal.querySelector('.ui-datepicker-title');
+            const days = [...cal.querySelectorAll('table.ui-datepicker-calendar td:not(.ui-state-disabled) a')]
+                .map(a => a.textContent.trim())
+                .filter(t => t.length > 0);
+            return {label: title ? title.textContent.trim() : '', days: days};
+        }
+        function step(index) {
+            const current = readMonth();
+            months.push(current);
+            const next = cal.querySelector('.ui-datepicker-next:not(.ui-state-disabled)');
+            if (index >= maxMonths - 1 || !next) { done(months); return; }
+            next.dispatchEvent(new MouseEvent('click', {bubbles: true, cancelable: true, view: window}));
+            const deadline = Date.now() + 3000;
+            (function poll() {
+                const title = cal.querySelector('.ui-datepicker-title');
+                const label = title ? title.textContent.trim() : '';
+                if (label && label !== current.label) { step(index + 1); return; }
+                if (Date.now() > deadline) { done(months); return; }
+                setTimeout(poll, 50);
+            })();
+        }
+        step(0);
+    """
+
     def _collect_available_dates(self, max_months: int = 3) -> List[str]:
         available: List[str] = []
 
+        driver = self.ensure_driver()
         calendar = self._is_selector_visible(self.DATEPICKER_CONTAINER_SELECTORS)
         if not calendar:
             logging.info("Calendar widget did not open; assuming no selectable dates available")
             return available
 
+        try:
+            months = driver.execute_async_script(self._COLLECT_MONTHS_ASYNC_JS, calendar, max_months)
+        except WebDriverException as exc:
+            logging.debug("Single-call calendar scan failed, using per-month fallback: %s", exc)
+            months = None
+
+        if months:
+            for month_index, month_data in enumerate(months):
+                month_label = (month_data.get("label") or "").strip() or f"Month {month_index + 1}"
+                for day_text in month_data.get("days", []):
+                    available.append(f"{month_label} {day_text}")
+            return available
+
         for month_index in range(max_months):
             if calendar is None or not calendar.is_displayed():
                 break
 
-            title_elements = calendar.find_elements(By.CSS_SELECTOR, ".ui-datepicker-title")
-            month_label = title_elements[0].text.strip() if title_elements else f"Month {month_index + 1}"
+            try:
+                month_data = driver.execute_script(self._AVAILABLE_DAYS_JS, calendar) or {}
+            except WebDriverException as exc:
+                logging.debug("In-browser day collection failed: %s", exc)
+                month_data = {}
 
-            day_links = calendar.find_elements(By.CSS_SELECTOR, "table.ui-datepicker-calendar td:not(.ui-state-disabled) a")
-            for link in day_links:
-                day_text = link.text.strip()
-                if not day_text:
-                    continue
+            month_label = (month_data.get("label") or "").strip() or f"Month {month_index + 1}"
+            for day_text in month_data.get("days", []):
                 available.append(f"{month_label} {day_text}")
 
             next_buttons = calendar.find_elements(By.CSS_SELECTOR, ".ui-datepicker-next:not(.ui-state-disabled)")
             if month_index == max_months - 1 or not next_buttons:
                 break
 
+            prev_label = (month_data.get("label") or "").strip()
             try:
                 next_buttons[0].click()
             except WebDriverException:
                 logging.debug("Failed to advance to next month in calendar")
                 break
 
-            time.sleep(0.5)
+            # Wait for the title to change rather than sleeping a fixed 500ms.
+            self._wait_condition(lambda d: self._datepicker_title() not in ("", prev_label))
             calendar = self._is_selector_visible(self.DATEPICKER_CONTAINER_SELECTORS)
             if not calendar:
                 break
@@ -3397,13 +3839,10 @@ class VisaAppointmentChecker:
         
         Sends notifications when better appointments are found.
         """
-        try:
-            current_date = datetime.strptime(self.cfg.current_appointment_date, "%Y-%m-%d")
-            start_date = datetime.strptime(self.cfg.start_date, "%Y-%m-%d")
-            end_date = datetime.strptime(self.cfg.end_date, "%Y-%m-%d")
-        except ValueError as exc:
-            logging.warning("Invalid date format in configuration: %s", exc)
+        parsed_dates = self._parsed_target_dates()
+        if parsed_dates is None:
             return
+        current_date, start_date, end_date = parsed_dates
 
         earlier_dates = []
         dates_in_range = []
@@ -3461,6 +3900,11 @@ class VisaAppointmentChecker:
                         )
                     earlier_dates.append(parsed_date)
 
+        if earlier_dates or dates_in_range:
+            # A live discovery resets the decorrelated-jitter stretch so the
+            # next checks run back at the base cadence.
+            self._prev_sleep = 0.0
+
         if earlier_dates:
             earliest = min(earlier_dates)
             days_earlier = (current_date - earliest).days
@@ -3495,7 +3939,7 @@ class VisaAppointmentChecker:
                 f"All earlier dates found: {', '.join(d.strftime('%Y-%m-%d') for d in sorted(earlier_dates))}\n\n"
                 f"{'🤖 Auto-book is ENABLED — attempting to book...' if self.cfg.auto_book else '⚠️ Login to book manually: https://ais.usvisa-info.com'}"
             )
-            send_notification(self.cfg, subject, message)
+            self._notify_async(subject, message)
             self._slot_ledger.mark_notified(slot_key, self.cfg.location)
             
             # ---- Auto-book pipeline (cascade) ----
@@ -3617,8 +4061,9 @@ class VisaAppointmentChecker:
                 date_input = self._find_element(self.CONSULATE_DATE_INPUT_SELECTORS, wait_time=5)
                 if date_input:
                     date_input.click()
-                    time.sleep(0.5)
-                    calendar = self._is_selector_visible(self.DATEPICKER_CONTAINER_SELECTORS)
+                    calendar = self._wait_condition(
+                        lambda d: self._is_selector_visible(self.DATEPICKER_CONTAINER_SELECTORS)
+                    )
 
             if not calendar:
                 logging.warning("%sAuto-book aborted: calendar not visible", tag)
@@ -3641,8 +4086,9 @@ class VisaAppointmentChecker:
                 if dry:
                     logging.info("%sWould click next-month to reach %s %s", tag, target_month, target_year)
                     return True  # Dry-run success
+                prev_title = self._datepicker_title()
                 next_btn[0].click()
-                time.sleep(0.5)
+                self._wait_condition(lambda d: self._datepicker_title() not in ("", prev_title))
                 calendar = self._is_selector_visible(self.DATEPICKER_CONTAINER_SELECTORS)
                 if not calendar:
                     return
@@ -3749,6 +4195,13 @@ class VisaAppointmentChecker:
 
     def _is_selector_visible(self, selectors: List[Selector]):
         driver = self.ensure_driver()
+        # One in-page evaluation of the whole group replaces K find_elements
+        # calls plus one is_displayed round-trip per candidate element.
+        payload = [{"by": by, "value": value} for by, value in selectors]
+        try:
+            return driver.execute_script(self._FIND_FIRST_JS, payload, False)
+        except WebDriverException as exc:
+            logging.debug("Fused visibility probe failed; using per-selector loop: %s", exc)
         for by, value in selectors:
             elements = driver.find_elements(by, value)
             for element in elements:
@@ -3762,9 +4215,43 @@ class VisaAppointmentChecker:
     # ------------------------------------------------------------------
     # Supporting helpers
     # ------------------------------------------------------------------
+    def _wait_condition(self, condition, timeout: float = 2.0):
+        """Best-effort short wait used where fixed sleeps once lived.
+
+        Returns the condition's truthy result, or None on timeout/driver
+        error — callers treat None exactly like the old post-sleep miss.
+        """
+        driver = self.driver
+        if driver is None:
+            return None
+        try:
+            return WebDriverWait(driver, timeout, poll_frequency=0.05).until(condition)
+        except (TimeoutException, WebDriverException):
+            return None
+
+    def _datepicker_title(self) -> str:
+        driver = self.driver
+        if driver is None:
+            return ""
+        try:
+            return driver.execute_script(
+                "const t = document.querySelector('.ui-datepicker-title');"
+                "return t ? t.textContent.trim() : '';"
+            ) or ""
+        except WebDriverException:
+            return ""
+
     def _wait_for_page_ready(self, driver: webdriver.Chrome, timeout: int = 30) -> None:
-        WebDriverWait(driver, timeout).until(
-            lambda d: d.execute_script("return document.readyState") == "complete"
+        # Single script covers readyState plus any visible loading spinner;
+        # 100ms polling shaves the up-to-499ms tail of the 500ms default.
+        # The DOM being parsed ('interactive') is enough under the eager page
+        # load strategy — sub-resources are mostly CDP-blocked anyway — so
+        # don't stall on readyState reaching 'complete'.
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+            lambda d: d.execute_script(
+                "const l = document.querySelector('.loading');"
+                "return document.readyState !== 'loading' && (!l || !l.offsetParent);"
+            )
         )
 
     def _session_expired_text_visible(self, driver: webdriver.Chrome) -> bool:
@@ -3890,6 +4377,30 @@ class VisaAppointmentChecker:
         # Session-expired modals block all interactions until acknowledged.
         self._acknowledge_session_expired_modal(driver)
 
+        # One in-page probe settles the common no-overlay case in a single
+        # round-trip instead of K find_elements + is_displayed calls.
+        probe_ok = True
+        element = None
+        try:
+            payload = [{"by": by, "value": value} for by, value in self.COOKIE_SELECTORS]
+            element = driver.execute_script(self._FIND_FIRST_JS, payload, True)
+        except WebDriverException as exc:
+            logging.debug("Overlay probe failed; using per-selector loop: %s", exc)
+            probe_ok = False
+
+        if probe_ok and element is None:
+            return
+
+        if element is not None:
+            try:
+                self._scroll_into_view(element)
+                element.click()
+                logging.info("Dismissed overlay via fused probe")
+                self._wait_condition(EC.staleness_of(element))
+                return
+            except (WebDriverException, StaleElementReferenceException):
+                logging.debug("Probed overlay click failed; using per-selector loop")
+
         for by, value in self.COOKIE_SELECTORS:
             elements = driver.find_elements(by, value)
             for element in elements:
@@ -3899,27 +4410,55 @@ class VisaAppointmentChecker:
                     self._scroll_into_view(element)
                     element.click()
                     logging.info("Dismissed overlay via selector %s=%s", by, value)
-                    time.sleep(0.5)
+                    # Return as soon as the overlay actually leaves the DOM.
+                    self._wait_condition(EC.staleness_of(element))
                     return
                 except (WebDriverException, StaleElementReferenceException):
                     logging.debug("Failed to dismiss overlay with %s=%s", by, value)
                     continue
 
+    # One poll = one command: the URL and any visible alert text come back
+    # together instead of a getCurrentUrl plus one find_elements per alert
+    # selector every 100ms.
+    _LOGIN_STATE_JS = """
+        const sels = arguments[0];
+        let hasAlert = false;
+        for (const sel of sels) {
+            for (const e of document.querySelectorAll(sel)) {
+                if ((e.offsetWidth || e.offsetHeight || e.getClientRects().length)
+                        && e.innerText.trim()) {
+                    hasAlert = true;
+                    break;
+                }
+            }
+            if (hasAlert) break;
+        }
+        return {url: location.href.toLowerCase(), hasAlert: hasAlert};
+    """
+
     def _await_login_transition(self, driver: webdriver.Chrome) -> None:
+        alert_css = [value for by, value in self.ALERT_SELECTORS if by == By.CSS_SELECTOR]
+
         def login_state(drv: webdriver.Chrome) -> bool:
-            url = drv.current_url.lower()
+            try:
+                state = drv.execute_script(self._LOGIN_STATE_JS, alert_css) or {}
+                url = state.get("url") or ""
+                has_alert = bool(state.get("hasAlert"))
+            except WebDriverException:
+                url = drv.current_url.lower()
+                has_alert = any(
+                    alert.is_displayed() and alert.text.strip()
+                    for by, value in self.ALERT_SELECTORS
+                    for alert in drv.find_elements(by, value)
+                )
             if "dashboard" in url or "schedule" in url or "groups" in url:
                 return True
             if "sign_in" not in url:
                 return True
-            for by, value in self.ALERT_SELECTORS:
-                for alert in drv.find_elements(by, value):
-                    if alert.is_displayed() and alert.text.strip():
-                        return True
-            return False
+            return has_alert
 
         try:
-            WebDriverWait(driver, 40).until(login_state)
+            WebDriverWait(driver, 40, poll_frequency=0.1).until(login_state)
         except TimeoutException:
             logging.warning("Login transition timed out; continuing with best effort.")
 
@@ -4032,17 +4571,134 @@ class VisaAppointmentChecker:
         self._scroll_into_view(element)
         return element
 
-    def _cache_form_elements(self, force_refresh: bool = False):
-        """Cache commonly used form elements to avoid repeated searches"""
-        if force_refresh or not hasattr(self, '_cached_elements'):
-            self._cached_elements = {}
-        
-        # Cache location selector if not already cached or if refresh forced
-        if force_refresh or 'location_select' not in self._cached_elements:
-            location_element = self._find_element_raw(self.LOCATION_SELECTORS, wait_time=5)
-            if location_element:
-                self._cached_elements['location_select'] = location_element
-                logging.debug("Cached location selector element")
+    # Resolves a whole selector group in-browser with one round-trip instead
+    # of one findElement HTTP call per selector. Every match per selector is
+    # scanned (like the legacy per-selector Python loop) so a hidden first
+    # sibling never masks a visible later one; returns the first visible
+    # (and, when requested, enabled) match, or null.
+    _FIND_FIRST_JS = """
+        const selectors = arguments[0];
+        const needEnabled = arguments[1];
+        function usable(el) {
+            if (!el) return null;
+            const style = window.getComputedStyle(el);
+            if (style.display === 'none' || style.visibility === 'hidden') return null;
+            if (!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)) return null;
+            if (needEnabled && el.disabled) return null;
+            return el;
+        }
+        function firstUsable(list) {
+            for (const el of list) {
+                if (usable(el)) return el;
+            }
+            return null;
+        }
+        for (const sel of selectors) {
+            let el = null;
+            try {
+                if (sel.by === 'id') el = usable(document.getElementById(sel.value));
+                else if (sel.by === 'name') el = firstUsable(document.getElementsByName(sel.value));
+                else if (sel.by === 'css selector') el = firstUsable(document.querySelectorAll(sel.value));
+                else if (sel.by === 'xpath') {
+                    const res = document.evaluate(
+                        sel.value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+                    );
+                    for (let i = 0; i < res.snapshotLength && !el; i++) {
+                        el = usable(res.snapshotItem(i));
+                    }
+                }
+            } catch (e) { el = null; }
+            if (el) return el;
+        }
+        return null;
+    """
+
+    def _find_first_js(self, selectors: List[Selector], *, clickable: bool = False):
+        """Try to resolve a selector group with a single execute_script call.
+
+        Only covers the top document; callers fall back to the per-selector
+        wait loop (which also walks iframes) when this returns None.
+        """
+        driver = self.driver
+        if driver is None:
+            return None
+        payload = [{"by": by, "value": value} for by, value in selectors]
+        try:
+            return driver.execute_script(self._FIND_FIRST_JS, payload, clickable)
+        except WebDriverException as exc:
+            logging.debug("JS fast-path selector lookup failed: %s", exc)
+            return None
+
+    def _wait_first_js(self, selectors: List[Selector], *, timeout: int, clickable: bool = False):
+        """Poll the fused in-browser lookup until it matches or times out.
+
+        One timeout covers the whole selector group and each poll is a
+        single round-trip, versus one WebDriverWait (dozens of round-trips)
+        per selector in the legacy loop. 50ms polling keeps the post-render
+        detection latency well under Selenium's 500ms default.
+        """
+        driver = self.driver
+        if driver is None:
+            return None
+        try:
+            return WebDriverWait(driver, timeout, poll_frequency=0.05).until(
+                lambda d: self._find_first_js(selectors, clickable=clickable)
+            )
+        except TimeoutException:
+            return None
+        except WebDriverException as exc:
+            logging.debug("Fused selector wait failed: %s", exc)
+            return None
+
+    # Probes every iframe in one round-trip: same-origin frames are searched
+    # through contentDocument with the same visibility rules as
+    # _FIND_FIRST_JS; cross-origin frames are opaque and flagged so Python
+    # still walks them serially.
+    _IFRAME_PROBE_JS = """
+        const selectors = arguments[0];
+        const needEnabled = arguments[1];
+        function usable(win, el) {
+            if (!el) return false;
+            const style = win.getComputedStyle(el);
+            if (style.display === 'none' || style.visibility === 'hidden') return false;
+            if (!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)) return false;
+            if (needEnabled && el.disabled) return false;
+            return true;
+        }
+        function anyUsable(win, list) {
+            for (const el of list) {
+                if (usable(win, el)) return true;
+            }
+            return false;
+        }
+        const frames = document.querySelectorAll('iframe');
+        const out = [];
+        for (let i = 0; i < frames.length; i++) {
+            let doc = null;
+            try { doc = frames[i].contentDocument; } catch (e) { doc = null; }
+            if (!doc) { out.push({index: i, crossOrigin: true, matched: false}); continue; }
+            const win = frames[i].contentWindow;
+            let matched = false;
+            for (const sel of selectors) {
+                try {
+                    if (sel.by === 'id') matched = usable(win, doc.getElementById(sel.value));
+                    else if (sel.by === 'name') matched = anyUsable(win, doc.getElementsByName(sel.value));
+                    else if (sel.by === 'css selector') matched = anyUsable(win, doc.querySelectorAll(sel.value));
+                    else if (sel.by === 'xpath') {
+                        const res = doc.evaluate(
+                            sel.value, doc, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+                        );
+                        for (let j = 0; j < res.snapshotLength && !matched; j++) {
+                            matched = usable(win, res.snapshotItem(j));
+                        }
+                    }
+                } catch (e) { matched = false; }
+                if (matched) break;
+            }
+            out.push({index: i, crossOrigin: false, matched: !!matched});
+        }
+        return out;
+    """
 
     def _find_element_raw(
         self,
@@ -4054,23 +4710,50 @@ class VisaAppointmentChecker:
         """Raw element finding without caching"""
         driver = self.ensure_driver()
         driver.switch_to.default_content()
-        contexts = [None] + driver.find_elements(By.TAG_NAME, "iframe")
 
-        for frame in contexts:
+        # Top document: one fused in-browser wait for the whole group. The
+        # first poll fires immediately, so present elements return in a
+        # single round-trip.
+        element = self._wait_first_js(selectors, timeout=wait_time, clickable=clickable)
+        if element is not None:
+            return element
+
+        # One JS probe tells us which frames can contain a match, so the
+        # serial per-frame walk (each miss costs a full wait_time) only runs
+        # for frames that matched or are cross-origin and unknowable. Pages
+        # without iframes (most of the post-login flow) skip the frame
+        # machinery — and its switch_to round-trips — entirely.
+        frames = driver.find_elements(By.TAG_NAME, "iframe")
+        if not frames:
+            return None
+        candidates = frames
+        try:
+            payload = [{"by": by, "value": value} for by, value in selectors]
+            probes = driver.execute_script(self._IFRAME_PROBE_JS, payload, clickable) or []
+            if len(probes) == len(frames):
+                candidates = [
+                    frames[probe["index"]]
+                    for probe in probes
+                    if probe.get("matched") or probe.get("crossOrigin")
+                ]
+        except WebDriverException as exc:
+            logging.debug("Iframe probe failed; walking all frames: %s", exc)
+
+        # Each iteration's finally already restores default content, so no
+        # extra switch is needed before entering the next frame.
+        for frame in candidates:
             try:
-                driver.switch_to.default_content()
-                if frame is not None:
-                    WebDriverWait(driver, wait_time).until(EC.frame_to_be_available_and_switch_to_it(frame))
+                WebDriverWait(driver, wait_time).until(EC.frame_to_be_available_and_switch_to_it(frame))
                 for by, value in selectors:
                     try:
-                        wait = WebDriverWait(driver, wait_time)
-                        if clickable:
-                            element = wait.until(EC.element_to_be_clickable((by, value)))
-                        else:
-                            element = wait.until(EC.visibility_of_element_located((by, value)))
-                        if element:
+                        # Presence is roughly half the per-poll wire cost of
+                        # the visibility condition; the display/enabled check
+                        # runs once, only on the matched element.
+                        wait = WebDriverWait(driver, wait_time, poll_frequency=0.1)
+                        element = wait.until(EC.presence_of_element_located((by, value)))
+                        if element and element.is_displayed() and (not clickable or element.is_enabled()):
                             return element
-                    except TimeoutException:
+                    except (TimeoutException, StaleElementReferenceException):
                         continue
             except TimeoutException:
                 continue
@@ -4085,21 +4768,17 @@ class VisaAppointmentChecker:
         *,
         wait_time: int = 10,
         clickable: bool = False,
-        use_cache: bool = True,
     ):
-        """Enhanced element finding with optional caching"""
-        # For commonly used elements, try cache first
-        if use_cache and hasattr(self, '_cached_elements'):
-            if selectors == self.LOCATION_SELECTORS and 'location_select' in self._cached_elements:
-                try:
-                    element = self._cached_elements['location_select']
-                    # Verify element is still valid
-                    element.is_enabled()  # This will throw if element is stale
-                    return element
-                except (StaleElementReferenceException, WebDriverException):
-                    # Remove stale element from cache
-                    del self._cached_elements['location_select']
-        
+        """Find an element, re-resolving selectors on every use.
+
+        WebElement references are deliberately not cached across calls:
+        cached handles go stale on every navigation and the resulting
+        StaleElementReferenceException retries cost more than the lookup
+        they were meant to save — especially now that _find_first_js makes
+        a fresh lookup a single round-trip. For the same reason there is no
+        validation probe here (is_enabled/is_displayed cost a round-trip
+        each); callers that hit a stale handle simply call this again.
+        """
         return self._find_element_raw(selectors, wait_time=wait_time, clickable=clickable)
 
     # ------------------------------------------------------------------
@@ -4357,62 +5036,96 @@ class VisaAppointmentChecker:
         if last_exc:
             raise last_exc
 
+    # Enumerates captcha iframes and widgets in one round-trip instead of
+    # find_elements plus two get_attribute and one is_displayed call per
+    # frame, plus one find_elements per widget selector.
+    _CAPTCHA_PROBE_JS = """
+        const widgetSelectors = arguments[0];
+        let iframes = 0;
+        for (const f of document.querySelectorAll('iframe')) {
+            const src = (f.getAttribute('src') || '').toLowerCase();
+            const title = (f.getAttribute('title') || '').toLowerCase();
+            if (!src && !title) continue;
+            if (src.includes('hcaptcha.com') || src.includes('recaptcha')
+                    || src.includes('turnstile') || title.includes('captcha')) {
+                if (f.offsetWidth || f.offsetHeight || f.getClientRects().length) iframes++;
+            }
+        }
+        let widgets = 0;
+        for (const sel of widgetSelectors) {
+            for (const e of document.querySelectorAll(sel)) {
+                if (e.offsetWidth || e.offsetHeight || e.getClientRects().length) widgets++;
+            }
+        }
+        return {iframes: iframes, widgets: widgets};
+    """
+
+    _CAPTCHA_WIDGET_SELECTORS = [
+        ".g-recaptcha",
+        ".grecaptcha-badge",
+        ".h-captcha",
+        ".cf-turnstile",
+        "[data-sitekey][class*='captcha']",
+        "div[aria-label*='captcha']",
+    ]
+
     def _detect_captcha(self) -> bool:
         driver = self.ensure_driver()
+
+        captcha_iframes: List = []
+        captcha_widgets: List = []
+        probed = None
         try:
-            iframe_candidates = driver.find_elements(By.TAG_NAME, "iframe")
-        except WebDriverException:
-            return False
+            probed = driver.execute_script(self._CAPTCHA_PROBE_JS, self._CAPTCHA_WIDGET_SELECTORS)
+        except WebDriverException as exc:
+            logging.debug("Captcha probe script failed; using per-element scan: %s", exc)
 
-        captcha_iframes = []
-        for frame in iframe_candidates:
+        if isinstance(probed, dict):
+            captcha_iframes = [True] * int(probed.get("iframes") or 0)
+            captcha_widgets = [True] * int(probed.get("widgets") or 0)
+        else:
             try:
-                src = (frame.get_attribute("src") or "").lower()
-                title = (frame.get_attribute("title") or "").lower()
-                if not src and not title:
-                    continue
-                if any(keyword in src for keyword in ("hcaptcha.com", "recaptcha", "turnstile")) or "captcha" in title:
-                    if frame.is_displayed():
-                        captcha_iframes.append(frame)
+                iframe_candidates = driver.find_elements(By.TAG_NAME, "iframe")
             except WebDriverException:
-                continue
+                return False
 
-        widget_selectors = [
-            ".g-recaptcha",
-            ".grecaptcha-badge",
-            ".h-captcha",
-            ".cf-turnstile",
-            "[data-sitekey][class*='captcha']",
-            "div[aria-label*='captcha']",
-        ]
-        captcha_widgets = []
-        for selector in widget_selectors:
-            try:
-                captcha_widgets.extend(
-                    [element for element in driver.find_elements(By.CSS_SELECTOR, selector) if element.is_displayed()]
-                )
-            except WebDriverException:
-                continue
+            for frame in iframe_candidates:
+                try:
+                    src = (frame.get_attribute("src") or "").lower()
+                    title = (frame.get_attribute("title") or "").lower()
+                    if not src and not title:
+                        continue
+                    if any(keyword in src for keyword in ("hcaptcha.com", "recaptcha", "turnstile")) or "captcha" in title:
+                        if frame.is_displayed():
+                            captcha_iframes.append(frame)
+                except WebDriverException:
+                    continue
 
-        challenge_keywords = (
-            "verify you are human",
-            "i am not a robot",
-            "please select all",
-            "captcha challenge",
-            "complete the security check",
-        )
-        page_source = ""
-        try:
-            page_source = driver.page_source.lower()
-        except WebDriverException:
-            page_source = ""
+            for selector in self._CAPTCHA_WIDGET_SELECTORS:
+                try:
+                    captcha_widgets.extend(
+                        [element for element in driver.find_elements(By.CSS_SELECTOR, selector) if element.is_displayed()]
+                    )
+                except WebDriverException:
+                    continue
 
-        page_mentions_challenge = any(keyword in page_source for keyword in challenge_keywords)
+        # Only pull the (potentially multi-MB) page source when the cheaper
+        # iframe/widget probes came up empty.
+        page_mentions_challenge = False
+        page_source = ""
+        if not (captcha_iframes or captcha_widgets):
+            try:
+                page_source = driver.page_source
+            except WebDriverException:
+                page_source = ""
+            page_mentions_challenge = bool(_CHALLENGE_RE.search(page_source))
 
         if captcha_iframes or captcha_widgets or page_mentions_challenge:
             logging.warning("Captcha challenge detected on page; automation paused.")
             self._audio_alert("captcha/manual intervention required")
-            self._capture_artifact("captcha_detected")
+            # Reuse the already-downloaded source so the artifact capture does
+            # not serialize the DOM a second time.
+            self._capture_artifact("captcha_detected", page_source=page_source or None)
             self._schedule_backoff()
             message = (
                 "Captcha detected - manual solve required"
@@ -4641,35 +5354,53 @@ class VisaAppointmentChecker:
         )
         raise CaptchaDetectedError(self._warning_ack_failed_message)
 
+    @staticmethod
+    def _short_freq_backoff(freq: float, multiplier: float) -> Tuple[float, float]:
+        """Backoff range for frequent checks (< 5 min): back off longer."""
+        return max(10, freq * 3 * multiplier), max(20, freq * 5 * multiplier)
+
+    @staticmethod
+    def _mid_freq_backoff(freq: float, multiplier: float) -> Tuple[float, float]:
+        """Backoff range for moderate checks (5-30 min)."""
+        return max(freq, 8 * multiplier), max(freq * 2, 15 * multiplier)
+
+    @staticmethod
+    def _long_freq_backoff(freq: float, multiplier: float) -> Tuple[float, float]:
+        """Backoff range for infrequent checks (> 30 min): back off less."""
+        return max(5, freq // 2 * multiplier), max(10, freq * multiplier)
+
+    # Branch table for the frequency tiers above; the upper threshold is
+    # nudged past 30 so bisect_right reproduces the historical
+    # `< 5` / `<= 30` / `else` boundaries exactly.
+    _FREQ_THRESHOLDS: Tuple[float, float] = (5.0, math.nextafter(30.0, math.inf))
+    _FREQ_BACKOFF_FNS = (_short_freq_backoff, _mid_freq_backoff, _long_freq_backoff)
+
     def _schedule_backoff(self) -> None:
+        # Hoist cfg to a local: this runs on every busy response and each
+        # self.cfg.<field> access walks the attribute/descriptor chain.
+        cfg = self.cfg
+
         # Use adaptive frequency if available, otherwise fall back to configured frequency
-        user_frequency = getattr(self, '_adaptive_frequency', self.cfg.check_frequency_minutes)
-        
-        # Strategic optimization: Reduce backoff during prime time
+        user_frequency = getattr(self, '_adaptive_frequency', cfg.check_frequency_minutes)
+
+        # Strategic optimization: Reduce backoff during prime time.
+        # Evaluate prime time once per call; each check builds a tz-aware datetime.
+        is_prime = self._is_prime_time()
         prime_time_multiplier = 1.0
-        if self._is_prime_time():
-            prime_time_multiplier = self.cfg.prime_time_backoff_multiplier
+        if is_prime:
+            prime_time_multiplier = cfg.prime_time_backoff_multiplier
             logging.debug("Applying prime time backoff reduction: %.1fx", prime_time_multiplier)
-        
+
         # Factor in busy streak for more intelligent backoff
         busy_multiplier = 1.0 + (self._busy_streak_count * 0.2)  # Increase by 20% per busy streak
-        
-        # Set backoff range based on frequency: 
-        # - For frequent checks (< 5 min): use longer backoff to avoid overloading
-        # - For moderate checks (5-30 min): use moderate backoff 
-        # - For infrequent checks (> 30 min): use shorter backoff
-        if user_frequency < 5:
-            min_backoff = max(10, user_frequency * 3 * busy_multiplier * prime_time_multiplier)
-            max_backoff = max(20, user_frequency * 5 * busy_multiplier * prime_time_multiplier)
-        elif user_frequency <= 30:
-            min_backoff = max(user_frequency, 8 * busy_multiplier * prime_time_multiplier)
-            max_backoff = max(user_frequency * 2, 15 * busy_multiplier * prime_time_multiplier)
-        else:
-            min_backoff = max(5, user_frequency // 2 * busy_multiplier * prime_time_multiplier)
-            max_backoff = max(10, user_frequency * busy_multiplier * prime_time_multiplier)
-        
+
+        # Select the backoff range via the precomputed frequency branch table
+        multiplier = busy_multiplier * prime_time_multiplier
+        tier = bisect.bisect_right(self._FREQ_THRESHOLDS, user_frequency)
+        min_backoff, max_backoff = self._FREQ_BACKOFF_FNS[tier](user_frequency, multiplier)
+
         # Ensure minimum backoff of 2 minutes during prime time
-        if self._is_prime_time():
+        if is_prime:
             min_backoff = max(2, min_backoff)
             max_backoff = max(min_backoff + 1, max_backoff)
         
@@ -4686,32 +5417,139 @@ class VisaAppointmentChecker:
         else:
             reason = f"current check interval ({user_frequency:.1f}m)"
         
-        if self._is_prime_time():
+        if is_prime:
             reason += " [PRIME TIME - reduced backoff]"
             
         logging.info("Backoff scheduled for %s minutes due to busy calendar response (adjusted for %s)", 
                     delay_minutes, reason)
 
-    def _capture_artifact(self, label: str) -> None:
+    @staticmethod
+    def _write_artifact_files(base: Path, page_source: Optional[str], png_bytes: Optional[bytes]) -> None:
+        """Persist already-fetched artifact payloads to disk (background thread)."""
+        if page_source is not None:
+            try:
+                base.with_suffix(".html").write_text(page_source, encoding="utf-8")
+                logging.info("📄 Saved HTML artifact: %s", base.with_suffix(".html"))
+            except Exception as exc:  # noqa: BLE001
+                logging.debug("Failed to persist page source artifact: %s", exc)
+
+        if png_bytes is not None:
+            try:
+                # Debug screenshots are visual sanity checks; JPEG at quality 70
+                # is ~5-10x smaller than PNG, so prefer it when Pillow is around.
+                if _PILImage is not None:
+                    shot_path = base.with_suffix(".jpg")
+                    _PILImage.open(BytesIO(png_bytes)).convert("RGB").save(
+                        str(shot_path), "JPEG", quality=70, optimize=True
+                    )
+                else:
+                    shot_path = base.with_suffix(".png")
+                    shot_path.write_bytes(png_bytes)
+                logging.info("📸 Saved screenshot: %s", shot_path)
+            except Exception as exc:  # noqa: BLE001
+                logging.debug("Failed to capture screenshot artifact: %s", exc)
+
+    def _capture_artifact(self, label: str, *, page_source: Optional[str] = None) -> None:
         driver = self.driver
         if driver is None:
             return
 
+        # Rate-limit per label: a persistent captcha/error page otherwise
+        # writes a fresh HTML+screenshot pair every cycle and fills the
+        # artifact cap within minutes.
+        artifact_last = getattr(self, "_artifact_last", None)
+        if artifact_last is not None:
+            now_monotonic = time.monotonic()
+            if now_monotonic - artifact_last.get(label, -float("inf")) < self.ARTIFACT_LABEL_MIN_INTERVAL_SECONDS:
+                logging.debug("Skipping artifact capture for %r (rate-limited)", label)
+                return
+
+        # Global token bucket across all labels: during an error flood with
+        # rotating exception types the per-label limiter alone still lets
+        # captures outpace _cleanup_artifacts.
+        now_monotonic = time.monotonic()
+        tokens = getattr(self, "_artifact_tokens", float(self.ARTIFACT_TOKEN_BUCKET_CAPACITY))
+        refill_anchor = getattr(self, "_artifact_refill", now_monotonic)
+        tokens = min(
+            float(self.ARTIFACT_TOKEN_BUCKET_CAPACITY),
+            tokens + (now_monotonic - refill_anchor) / self.ARTIFACT_TOKEN_REFILL_SECONDS,
+        )
+        self._artifact_refill = now_monotonic
+        if tokens < 1.0:
+            self._artifact_tokens = tokens
+            logging.debug("Skipping artifact capture for %r (capture budget exhausted)", label)
+            return
+        self._artifact_tokens = tokens - 1.0
+
+        try:
+            free_bytes = shutil.disk_usage(ARTIFACTS_DIR).free
+        except OSError:
+            free_bytes = None
+        if free_bytes is not None and free_bytes < self.ARTIFACT_MIN_FREE_DISK_BYTES:
+            if not getattr(self, "_artifact_disk_warned", False):
+                self._artifact_disk_warned = True
+                # INFO on purpose: a WARNING here would trip the warning
+                # screenshot handler and write to the disk we are protecting.
+                logging.info(
+                    "Skipping artifact captures: only %d MB free under %s",
+                    free_bytes // (1024 * 1024), ARTIFACTS_DIR,
+                )
+            return
+        self._artifact_disk_warned = False
+
+        # Stamp the label only once every gate has passed: a capture rejected
+        # by the token bucket or disk check must not suppress the label for
+        # the full interval with nothing written.
+        if artifact_last is not None:
+            artifact_last[label] = now_monotonic
+
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
         safe_label = label.replace(" ", "_")
         base = ARTIFACTS_DIR / f"{timestamp}_{safe_label}"
 
+        # Fetch payloads on the WebDriver-owning thread; only the disk writes
+        # are offloaded so the check loop resumes immediately. Callers that
+        # already hold the source pass it in to skip the second DOM dump.
+        if page_source is None:
+            try:
+                page_source = driver.page_source
+            except Exception as exc:  # noqa: BLE001
+                logging.debug("Failed to fetch page source for artifact: %s", exc)
+
+        png_bytes: Optional[bytes] = None
         try:
-            base.with_suffix(".html").write_text(driver.page_source, encoding="utf-8")
-            logging.info("📄 Saved HTML artifact: %s", base.with_suffix(".html"))
+            png_bytes = driver.get_screenshot_as_png()
         except Exception as exc:  # noqa: BLE001
-            logging.debug("Failed to persist page source artifact: %s", exc)
+            logging.debug("Failed to fetch screenshot for artifact: %s", exc)
+
+        if page_source is None and png_bytes is None:
+            return
+
+        pool = getattr(self, "_artifact_pool", None)
+        if pool is None:
+            self._write_artifact_files(base, page_source, png_bytes)
+            return
+
+        with self._artifact_pending_lock:
+            if self._artifact_pending >= 8:
+                logging.debug("Artifact write queue full; dropping capture %s", label)
+                return
+            self._artifact_pending += 1
+
+        def _run() -> None:
+            try:
+                self._write_artifact_files(base, page_source, png_bytes)
+            finally:
+                with self._artifact_pending_lock:
+                    self._artifact_pending -= 1
 
         try:
-            driver.save_screenshot(str(base.with_suffix(".png")))
-            logging.info("📸 Saved screenshot: %s", base.with_suffix(".png"))
-        except Exception as exc:  # noqa: BLE001
-            logging.debug("Failed to capture screenshot artifact: %s", exc)
+            pool.submit(_run)
+        except RuntimeError:
+            # Pool already shut down — fall back to a synchronous write.
+            with self._artifact_pending_lock:
+                self._artifact_pending -= 1
+            self._write_artifact_files(base, page_source, png_bytes)
 
     def _capture_warning_artifact_for_record(self, record: logging.LogRecord) -> None:
         """Persist a PNG screenshot for warning/error logs when a browser session exists."""
@@ -4759,7 +5597,21 @@ class VisaAppointmentChecker:
         screenshot_path = ARTIFACTS_DIR / f"{timestamp}_warning_{safe_msg}.png"
 
         try:
-            driver.save_screenshot(str(screenshot_path))
+            # Grab the PNG bytes on the driver thread; push the disk write to
+            # the artifact pool like the other artifact paths.
+            png_bytes = driver.get_screenshot_as_png()
+            pool = getattr(self, "_artifact_pool", None)
+
+            def _write() -> None:
+                screenshot_path.write_bytes(png_bytes)
+
+            if pool is not None:
+                try:
+                    pool.submit(_write)
+                except RuntimeError:
+                    _write()
+            else:
+                _write()
             logging.info("📸 Saved WARNING screenshot: %s", screenshot_path)
         except Exception as exc:  # noqa: BLE001
             logging.debug("Failed to capture warning screenshot: %s", exc)
@@ -4825,16 +5677,17 @@ class VisaAppointmentChecker:
             else:
                 logging.info("   %s: %s", name, status)
 
-        # Check for common page indicators
+        # Check for common page indicators with a single alternation scan
         try:
-            page_source = driver.page_source.lower()
+            page_source = driver.page_source
+            hits = {match.lastgroup for match in _DEBUG_INDICATOR_RE.finditer(page_source)}
             indicators = [
-                ("Scheduling Limit Warning", "scheduling limit warning" in page_source),
-                ("Login Form", "user[email]" in page_source or "sign_in" in page_source),
-                ("Appointment Form", "consulate_appointment" in page_source),
-                ("Calendar Busy", "not_available" in page_source or "no appointments" in page_source.lower()),
-                ("CAPTCHA", "captcha" in page_source or "recaptcha" in page_source),
-                ("Error Message", "error" in page_source and "alert" in page_source),
+                ("Scheduling Limit Warning", "limit" in hits),
+                ("Login Form", "login" in hits),
+                ("Appointment Form", "appt" in hits),
+                ("Calendar Busy", "busy" in hits),
+                ("CAPTCHA", "captcha" in hits),
+                ("Error Message", "error" in hits and "alert" in hits),
             ]
             logging.info("🔎 Page Content Indicators:")
             for name, present in indicators:
@@ -4862,26 +5715,19 @@ class VisaAppointmentChecker:
         """Return True when the current page is AIS Scheduling Limit Warning."""
         drv = driver or self.ensure_driver()
         try:
-            title = (drv.title or "").lower()
+            title = drv.title or ""
         except Exception:  # noqa: BLE001
             title = ""
 
-        if "scheduling limit warning" in title:
+        if _SCHEDULING_LIMIT_RE.search(title):
             return True
 
         try:
-            source = (drv.page_source or "").lower()
+            source = drv.page_source or ""
         except Exception:  # noqa: BLE001
             source = ""
 
-        markers = (
-            "scheduling limit warning",
-            "you have reached the maximum number of times",
-            "please click continue to proceed",
-            "maximum number of 3 cancellations/reschedules",
-            "you have 3 remaining attempt",
-        )
-        return any(marker in source for marker in markers)
+        return bool(_SCHEDULING_LIMIT_PAGE_RE.search(source))
 
     def _log_scheduling_limit_warning(self, driver: webdriver.Chrome, *, context: str = "") -> None:
         """Log Scheduling Limit Warning detection with light spam suppression."""
@@ -4934,6 +5780,18 @@ class VisaAppointmentChecker:
         if not self._heartbeat_path:
             return
 
+        # Throttle unchanged-status writes so a tight polling cadence doesn't
+        # hit the disk on every check.
+        now_monotonic = time.monotonic()
+        last_heartbeat = getattr(self, "_last_heartbeat", None)
+        if last_heartbeat is not None:
+            last_status, last_write_ts = last_heartbeat
+            if (
+                status == last_status
+                and (now_monotonic - last_write_ts) < self.HEARTBEAT_MIN_WRITE_INTERVAL_SECONDS
+            ):
+                return
+
         api_total = self._api_check_count
         ui_total = self._ui_check_count
         gate_status = self._gate_status_snapshot()
@@ -4958,19 +5816,42 @@ class VisaAppointmentChecker:
             "facility_priority": self._facility_priority_snapshot(),
         }
 
+        heartbeat_path = self._heartbeat_path
+        # Compact separators: the heartbeat is machine-read, and skipping the
+        # indented pretty-print trims ~30% off every rewrite.
+        serialized = json.dumps(payload, separators=(",", ":"))
+
+        def _write() -> None:
+            try:
+                # Write to a temp file and atomically rename so a crash mid-write
+                # never leaves a truncated heartbeat behind.
+                tmp_path = heartbeat_path.with_suffix(".tmp")
+                tmp_path.write_text(serialized, encoding="utf-8")
+                os.replace(tmp_path, heartbeat_path)
+            except Exception as exc:  # noqa: BLE001
+                logging.debug("Failed to write heartbeat file: %s", exc)
+
+        # Mark the write as done up-front: even if the disk write lags behind
+        # on the background pool, a newer heartbeat superseding it is fine.
+        self._last_heartbeat = (status, now_monotonic)
+
+        pool = getattr(self, "_artifact_pool", None)
+        if pool is None:
+            _write()
+            return
         try:
-            self._heartbeat_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-        except Exception as exc:  # noqa: BLE001
-            logging.debug("Failed to write heartbeat file: %s", exc)
+            pool.submit(_write)
+        except RuntimeError:
+            _write()
 
     def _calculate_dynamic_backoff(self) -> int:
         """Calculate backoff based on error patterns and success rate"""
         # Use adaptive frequency if available
         base_minutes = getattr(self, '_adaptive_frequency', self.cfg.check_frequency_minutes)
         
-        # Track success rate over last 10 attempts
+        # Track success rate over last 10 attempts (running counter, O(1) read)
         if len(self._recent_results) >= 3:
-            success_rate = sum(self._recent_results[-10:]) / len(self._recent_results[-10:])
+            success_rate = self._recent_success_count / len(self._recent_results)
         else:
             success_rate = 1.0  # Assume good performance initially
         
@@ -4989,67 +5870,177 @@ class VisaAppointmentChecker:
         return int(dynamic_minutes)
 
     def compute_sleep_seconds(self, base_minutes: int) -> int:
+        cfg = self.cfg
+        is_prime = self._is_prime_time()
         sleep_seconds, self._backoff_until = compute_sleep_seconds_external(
             base_minutes=base_minutes,
             optimal_minutes=self._calculate_optimal_frequency(),
             dynamic_backoff_minutes=self._calculate_dynamic_backoff(),
-            sleep_jitter_seconds=self.cfg.sleep_jitter_seconds,
-            is_prime_time=self._is_prime_time(),
+            sleep_jitter_seconds=cfg.sleep_jitter_seconds,
+            is_prime_time=is_prime,
             backoff_until=self._backoff_until,
+            elapsed_seconds=getattr(self, "_last_check_duration", 0.0),
         )
-        if self.cfg.safety_first_mode:
-            min_interval = max(1, self.cfg.safety_first_min_interval_minutes) * 60
+        # Decorrelated jitter off-peak: each empty check stretches the next
+        # sleep to random.uniform(floor, prev*3) capped at 4x the base
+        # cadence, and a slot discovery resets the stretch. Prime-time and
+        # scheduled-backoff cycles keep the scheduler's exact value so the
+        # aggressive windows stay aggressive.
+        if not is_prime and self._backoff_until is None:
+            floor = float(sleep_seconds)
+            cap = max(floor, float(base_minutes * 60 * 4))
+            prev = float(getattr(self, "_prev_sleep", 0.0)) or floor
+            stretched = min(cap, random.uniform(floor, max(floor, prev * 3)))
+            self._prev_sleep = stretched
+            sleep_seconds = int(stretched)
+        else:
+            self._prev_sleep = float(sleep_seconds)
+        if cfg.safety_first_mode:
+            min_interval = max(1, cfg.safety_first_min_interval_minutes) * 60
             sleep_seconds = max(sleep_seconds, min_interval)
         return sleep_seconds
 
+    def sleep_with_keepalive(self, sleep_seconds: int) -> None:
+        """Sleep between checks in keepalive-sized slices.
+
+        A single multi-minute ``time.sleep`` lets the WebDriver session go
+        idle long enough that some networks silently drop it, forcing a full
+        driver re-init on the next check.  Waiting in 60-second slices and
+        touching ``driver.title`` keeps the session warm; if the ping fails
+        the nap ends early so the next check can rebuild the session. The
+        wake event is shared so wake_early() (e.g. from a signal handler or
+        a future notification callback) cancels the nap immediately.
+        """
+        wake = getattr(self, "_sleep_wake", None)
+        if wake is None:
+            wake = self._sleep_wake = threading.Event()
+        wake.clear()
+        deadline = time.monotonic() + max(0, sleep_seconds)
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            wake.wait(min(remaining, 60))
+            if wake.is_set():
+                logging.info("Sleep interrupted by wake_early(); resuming checks now")
+                return
+            if deadline - time.monotonic() <= 0:
+                return
+            driver = self.driver
+            if driver is None:
+                continue
+            try:
+                _ = driver.title  # lightweight keepalive ping
+            except WebDriverException as exc:
+                logging.warning(
+                    "Driver keepalive failed during sleep; session will be rebuilt on next check: %s",
+                    exc,
+                )
+                return
+
+    def wake_early(self) -> None:
+        """Cancel an in-progress sleep_with_keepalive() nap from any thread."""
+        wake = getattr(self, "_sleep_wake", None)
+        if wake is not None:
+            wake.set()
+
     def _track_performance(self, operation: str, duration: float):
         """Track performance metrics for various operations"""
         if operation not in self._metrics:
-            self._metrics[operation] = []
-        
-        self._metrics[operation].append(duration)
-        
-        # Keep only last 20 measurements to avoid memory bloat
-        if len(self._metrics[operation]) > 20:
-            self._metrics[operation] = self._metrics[operation][-20:]
-        
-        # Log performance stats every 10 measurements
-        if len(self._metrics[operation]) % 10 == 0:
-            recent_measurements = self._metrics[operation][-10:]
-            avg_time = sum(recent_measurements) / len(recent_measurements)
-            max_time = max(recent_measurements)
-            min_time = min(recent_measurements)
-            logging.info("Performance stats [%s]: avg=%.2fs, min=%.2fs, max=%.2fs", 
-                        operation, avg_time, min_time, max_time)
+            # Fixed-size deque drops the oldest sample in O(1) with no reallocation
+            self._metrics[operation] = deque(maxlen=20)
+
+        samples = self._metrics[operation]
+        samples.append(duration)
+
+        # Monotonic per-operation sample count; len(samples) stops growing
+        # once the deque pins at maxlen, so it cannot drive the stats cadence.
+        counts = getattr(self, "_metrics_counts", None)
+        if counts is None:
+            counts = self._metrics_counts = {}
+        counts[operation] = counts.get(operation, 0) + 1
+
+        # O(1) exponential moving average; smoother than the old window mean
+        # and free to read at any time.
+        prev_ema = self._metrics_ema.get(operation)
+        self._metrics_ema[operation] = (
+            duration if prev_ema is None else 0.1 * duration + 0.9 * prev_ema
+        )
+
+        # Running min/max since the last stats log, updated in O(1) per sample
+        # so the log line never rescans the sample window.
+        extrema = getattr(self, "_metrics_extrema", None)
+        if extrema is None:
+            extrema = self._metrics_extrema = {}
+        lo, hi = extrema.get(operation, (duration, duration))
+        extrema[operation] = (min(lo, duration), max(hi, duration))
+
+        # Log performance stats every 10 measurements; skip the whole branch
+        # (including the extrema window reset) when INFO is filtered out.
+        if counts[operation] % 10 == 0 and logging.getLogger().isEnabledFor(logging.INFO):
+            lo, hi = extrema.pop(operation)
+            logging.info(
+                "Performance stats [%s]: ema=%.2fs, min=%.2fs, max=%.2fs",
+                operation, self._metrics_ema[operation], lo, hi,
+            )
 
     def _cleanup_artifacts(self):
-        """Remove old artifacts to prevent disk bloat"""
+        """Remove old artifacts to prevent disk bloat.
+
+        Uses a single ``os.scandir`` pass (DirEntry caches its stat result) and
+        ``heapq.nsmallest`` so we only select the oldest entries instead of
+        fully sorting and re-stat-ing every file on each cleanup cycle.
+        """
         try:
-            html_files = list(ARTIFACTS_DIR.glob("*.html"))
-            if len(html_files) > 50:
-                # Sort by creation time and remove oldest files
-                html_files.sort(key=lambda x: x.stat().st_ctime)
-                old_files = html_files[:30]
-                for file_path in old_files:
-                    try:
-                        file_path.unlink()
-                        # Also remove corresponding PNG file
-                        png_path = file_path.with_suffix('.png')
-                        if png_path.exists():
-                            png_path.unlink()
-                    except Exception:
-                        pass
+            # Cheap name-only counting pass first: in the steady state neither
+            # cap is exceeded and we return without stat-ing a single file.
+            html_count = 0
+            warning_png_count = 0
+            with os.scandir(ARTIFACTS_DIR) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".html"):
+                        html_count += 1
+                    elif entry.name.endswith((".png", ".jpg")) and "_warning_" in entry.name:
+                        warning_png_count += 1
+            prune_html = html_count > 50
+            prune_warning_pngs = warning_png_count > 200
+            if not prune_html and not prune_warning_pngs:
+                return
+
+            html_entries: List[Tuple[float, str]] = []
+            warning_png_entries: List[Tuple[float, str]] = []
+            with os.scandir(ARTIFACTS_DIR) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    if prune_html and entry.name.endswith(".html"):
+                        html_entries.append((entry.stat().st_ctime, entry.path))
+                    elif (
+                        prune_warning_pngs
+                        and entry.name.endswith((".png", ".jpg"))
+                        and "_warning_" in entry.name
+                    ):
+                        warning_png_entries.append((entry.stat().st_ctime, entry.path))
+
+            if len(html_entries) > 50:
+                old_files = heapq.nsmallest(30, html_entries)
+                for _, file_path in old_files:
+                    with contextlib.suppress(OSError):
+                        os.unlink(file_path)
+                    # Remove the companion screenshot without a stat-then-unlink
+                    # race: just attempt the unlink and swallow the miss.
+                    for shot_suffix in (".jpg", ".png"):
+                        with contextlib.suppress(OSError):
+                            os.unlink(file_path[: -len(".html")] + shot_suffix)
                 logging.debug("Cleaned up %d old artifact files", len(old_files))
 
-            warning_png_files = list(ARTIFACTS_DIR.glob("*_warning_*.png"))
-            if len(warning_png_files) > 200:
-                warning_png_files.sort(key=lambda x: x.stat().st_ctime)
-                stale_warning_pngs = warning_png_files[: len(warning_png_files) - 150]
-                for file_path in stale_warning_pngs:
-                    try:
-                        file_path.unlink()
-                    except Exception:
-                        pass
+            if len(warning_png_entries) > 200:
+                stale_warning_pngs = heapq.nsmallest(
+                    len(warning_png_entries) - 150, warning_png_entries
+                )
+                for _, file_path in stale_warning_pngs:
+                    with contextlib.suppress(OSError):
+                        os.unlink(file_path)
                 logging.debug("Cleaned up %d old warning screenshots", len(stale_warning_pngs))
         except Exception as exc:
             logging.debug("Artifact cleanup failed: %s", exc)
@@ -5058,10 +6049,24 @@ class VisaAppointmentChecker:
         self._checks_since_restart += 1
         self._update_heartbeat("success" if success else "failure")
         
-        # Track success rate
-        self._recent_results.append(1 if success else 0)
-        if len(self._recent_results) > 10:
-            self._recent_results = self._recent_results[-10:]
+        # Track success rate (deque maxlen drops results older than the last 10);
+        # maintain a running success count so reading the rate is O(1).
+        value = 1 if success else 0
+        evicted = 0
+        if len(self._recent_results) == self._recent_results.maxlen:
+            evicted = self._recent_results[0]
+        self._recent_results.append(value)
+        self._recent_success_count += value - evicted
+
+        # Drain chromedriver's buffered logs so they cannot accumulate for a
+        # whole 50-check window between driver restarts.
+        driver = self.driver
+        if driver is not None:
+            for log_type in ("browser", "driver"):
+                try:
+                    driver.get_log(log_type)
+                except Exception:  # noqa: BLE001
+                    break  # Driver gone or log type unsupported
 
         # Periodic cleanup every 10 checks
         if self._checks_since_restart % 10 == 0:
@@ -5079,17 +6084,26 @@ class VisaAppointmentChecker:
             self.reset_driver()
             self._checks_since_restart = 0
 
+    _NOTIF_CACHE_MAX_ENTRIES: int = 32
+    _NOTIF_DEBOUNCE_SECONDS: float = 30 * 60.0
+
     def _handle_error(self, exc: Exception) -> None:
-        signature = f"{type(exc).__name__}:{str(exc)}"
-        now = datetime.now(timezone.utc)
+        error_message = str(exc)
+        # Hash the signature so unbounded exception text cannot bloat the keys.
+        signature = hashlib.blake2b(
+            f"{type(exc).__name__}:{error_message}".encode("utf-8", "replace"),
+            digest_size=8,
+        ).hexdigest()
+        # Monotonic clock for the debounce window: immune to NTP steps and
+        # DST jumps that would otherwise stretch or collapse the interval.
+        now = time.monotonic()
 
         # Skip heavy artifact capture for network errors (nothing useful to capture)
         if not self._is_network_error(exc):
             self._capture_artifact(f"error_{type(exc).__name__.lower()}")
 
         # If this is a rate limiting or login issue, schedule a longer backoff
-        error_message = str(exc).lower()
-        if any(keyword in error_message for keyword in ["rate limiting", "sign in or sign up", "login blocked"]):
+        if _LOGIN_RATE_LIMIT_RE.search(error_message):
             # Schedule a longer backoff for login issues
             backoff_minutes = max(15, self.cfg.check_frequency_minutes * 3)
             self._backoff_until = datetime.now() + timedelta(minutes=backoff_minutes)
@@ -5101,20 +6115,25 @@ class VisaAppointmentChecker:
             logging.info("Skipping error notification — network is unreachable")
             return
 
-        notify = True
-        if self._last_error_signature == signature and self._last_notification_time:
-            elapsed = now - self._last_notification_time
-            if elapsed < timedelta(minutes=30):
+        cache = getattr(self, "_notif_cache", None)
+        if cache is None:
+            cache = self._notif_cache = OrderedDict()
+
+        last_sent = cache.get(signature)
+        if last_sent is not None:
+            elapsed = now - last_sent
+            if elapsed < self._NOTIF_DEBOUNCE_SECONDS:
                 logging.info(
                     "Skipping duplicate notification (last sent %.1f minutes ago)",
-                    elapsed.total_seconds() / 60,
+                    elapsed / 60,
                 )
-                notify = False
+                return
 
-        if notify:
-            if send_notification(self.cfg, "Visa Appointment Checker Error", str(exc)):
-                self._last_error_signature = signature
-                self._last_notification_time = now
+        if send_notification(self.cfg, "Visa Appointment Checker Error", error_message):
+            cache[signature] = now
+            cache.move_to_end(signature)
+            while len(cache) > self._NOTIF_CACHE_MAX_ENTRIES:
+                cache.popitem(last=False)
 
 
 def _probe_writable_directory(path: Path, *, label: str) -> Tuple[bool, str]:
@@ -5182,18 +6201,25 @@ def run_self_check(cfg: CheckerConfig, *, selectors_file: str) -> bool:
     try:
         resolved_driver_path: Optional[str] = None
         try:
-            resolved_driver_path = ChromeDriverManager().install()
+            resolved_driver_path = _resolve_chromedriver_path()
             print(f"✅ WebDriver manager resolved driver: {resolved_driver_path}")
         except Exception as exc:  # noqa: BLE001
             print(f"⚠️ WebDriver manager resolution failed, trying Selenium Manager fallback: {exc}")
 
         options = build_chrome_options(headless=True)
         options.add_argument("--disable-gpu")
-        if resolved_driver_path and Path(resolved_driver_path).exists():
-            driver = webdriver.Chrome(service=Service(resolved_driver_path), options=options)
-        else:
-            driver = webdriver.Chrome(options=options)
-        driver.quit()
+        # The persistent profile may be owned by a running checker; probe with
+        # a throwaway profile so self-check never collides with the service.
+        probe_profile = tempfile.mkdtemp(prefix="visa-selfcheck-profile-")
+        options.add_argument(f"--user-data-dir={probe_profile}")
+        try:
+            if resolved_driver_path and Path(resolved_driver_path).exists():
+                driver = webdriver.Chrome(service=Service(resolved_driver_path), options=options)
+            else:
+                driver = webdriver.Chrome(options=options)
+            driver.quit()
+        finally:
+            shutil.rmtree(probe_profile, ignore_errors=True)
         print("✅ WebDriver launch/quit readiness passed")
     except Exception as exc:  # noqa: BLE001
         print(f"❌ WebDriver readiness failed: {exc}")
@@ -5388,9 +6414,10 @@ def main() -> None:
             # ---- Network pre-check ----
             if checker._account_lockout_until and datetime.now() < checker._account_lockout_until:
                 wait_secs = (checker._account_lockout_until - datetime.now()).total_seconds()
-                print(
-                    f"🔒 Account locked — sleeping {int(wait_secs)}s "
-                    f"(until {checker._account_lockout_until.strftime('%Y-%m-%d %H:%M:%S')})"
+                _status(
+                    "🔒 Account locked — sleeping %ds (until %s)",
+                    wait_secs,
+                    checker._account_lockout_until.strftime("%Y-%m-%d %H:%M:%S"),
                 )
                 time.sleep(max(1, wait_secs))
                 continue
@@ -5399,52 +6426,54 @@ def main() -> None:
             # burning a Chrome launch + page load cycle.
             if checker._network_backoff_until and datetime.now() < checker._network_backoff_until:
                 wait_secs = (checker._network_backoff_until - datetime.now()).total_seconds()
-                print(
-                    f"🌐 Network backoff active — sleeping {int(wait_secs)}s "
-                    f"(until {checker._network_backoff_until.strftime('%H:%M:%S')})"
+                _status(
+                    "🌐 Network backoff active — sleeping %ds (until %s)",
+                    wait_secs,
+                    checker._network_backoff_until.strftime("%H:%M:%S"),
                 )
                 time.sleep(max(1, wait_secs))
                 # Quick connectivity probe before proceeding
                 if not checker._check_internet_connectivity():
                     backoff = checker._record_network_failure()
-                    print(f"🌐 Still offline — extending backoff by {backoff}s")
+                    _status("🌐 Still offline — extending backoff by %ss", backoff)
                     continue
 
             if not checker._ensure_vpn_ready(reason="pre-check"):
                 retry_secs = max(30, checker.cfg.retry_backoff_seconds)
-                print(
-                    f"🛡️ Proton VPN required but not connected — retrying in {retry_secs}s"
-                )
+                _status("🛡️ Proton VPN required but not connected — retrying in %ss", retry_secs)
                 time.sleep(retry_secs)
                 continue
 
-            print(f"\n🔄 Starting check #{check_count} at {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
-            print("-" * 30)
+            _status(
+                "🔄 Starting check #%d at %s",
+                check_count,
+                start_time.strftime("%Y-%m-%d %H:%M:%S"),
+            )
 
             success = False
             captcha_detected = False
             network_error = False
             try:
                 checker.perform_check()
-                print(f"✅ Check #{check_count} completed successfully")
+                _status("✅ Check #%d completed successfully", check_count)
                 success = True
                 checker._record_network_success()
             except AccountLockedError as exc:
-                print(f"🔒 Check #{check_count} paused due to account lock: {exc}")
+                _status("🔒 Check #%d paused due to account lock: %s", check_count, exc)
             except UiRateLimitError as exc:
-                print(f"⏸️ Check #{check_count} skipped due to UI rate limit: {exc}")
+                _status("⏸️ Check #%d skipped due to UI rate limit: %s", check_count, exc)
             except CaptchaDetectedError as exc:
-                print(f"🤖 Check #{check_count} blocked by captcha: {exc}")
+                _status("🤖 Check #%d blocked by captcha: %s", check_count, exc)
                 captcha_detected = True
                 # Captcha means we reached the server — network is fine
                 checker._record_network_success()
                 checker._handle_vpn_captcha()
             except Exception as exc:  # noqa: BLE001
-                print(f"❌ Check #{check_count} failed: {exc}")
+                _status("❌ Check #%d failed: %s", check_count, exc)
                 if checker._is_network_error(exc):
                     network_error = True
                     backoff = checker._record_network_failure()
-                    print(f"🌐 Network error detected — will retry in {backoff}s")
+                    _status("🌐 Network error detected — will retry in %ss", backoff)
                     checker._handle_vpn_network_issue()
 
             # Record stats for progress reporter
@@ -5458,36 +6487,39 @@ def main() -> None:
             if network_error and checker._network_backoff_until:
                 remaining = (checker._network_backoff_until - datetime.now()).total_seconds()
                 if remaining > 0:
-                    print(
-                        f"⏰ Network backoff until "
-                        f"{checker._network_backoff_until.strftime('%H:%M:%S')}"
+                    _status(
+                        "⏰ Network backoff until %s",
+                        checker._network_backoff_until.strftime("%H:%M:%S"),
                     )
-                    print("💤 Sleeping (network recovery)...")
+                    _status("💤 Sleeping (network recovery)...")
                     time.sleep(remaining)
                     if args.run_once:
                         break
                     continue
 
             if args.run_once:
-                print("✅ --run-once mode complete. Exiting after a single cycle.")
+                _status("✅ --run-once mode complete. Exiting after a single cycle.")
                 break
 
             sleep_seconds = checker.compute_sleep_seconds(frequency)
             next_check = datetime.now() + timedelta(seconds=sleep_seconds)
             minutes, seconds = divmod(sleep_seconds, 60)
-            print(
-                f"⏰ Next check at: {next_check.strftime('%H:%M:%S')} (in {minutes}m {seconds}s)"
+            _status(
+                "⏰ Next check at: %s (in %dm %ds)",
+                next_check.strftime("%H:%M:%S"),
+                minutes,
+                seconds,
             )
-            print("💤 Sleeping...")
+            _status("💤 Sleeping...")
 
-            time.sleep(sleep_seconds)
+            checker.sleep_with_keepalive(sleep_seconds)
     except KeyboardInterrupt:
-        print("\n🛑 Stopping visa appointment checker (KeyboardInterrupt)")
+        _status("🛑 Stopping visa appointment checker (KeyboardInterrupt)")
     finally:
         if reporter:
             reporter.stop()
         checker.shutdown()
-        print("🧹 Browser session closed")
+        _status("🧹 Browser session closed")
 
 
 if __name__ == "__main__":
@@ -1066,9 +1066,10 @@ def index():
             )
             return render_template('index.html', current=updates)
 
-        CONFIG_MANAGER.save_updates(updates)
-
-        flash('🚀 Strategic configuration saved successfully! Your optimization settings are now active.', 'success')
+        if CONFIG_MANAGER.save_updates(updates):
+            flash('🚀 Strategic configuration saved successfully! Your optimization settings are now active.', 'success')
+        else:
+            flash('No configuration changes detected — settings left as-is.', 'success')
         return redirect(url_for('index'))
 
     return render_template('index.html', current=current)
@@ -1481,9 +1482,11 @@ if __name__ == '__main__':
         return port
     
     port = args.port
+    # threaded=True gives Werkzeug a thread per request so a slow GET
+    # (log tail, service status) never serializes behind a config POST.
     try:
-        app.run(debug=False, port=port, host=args.host)
+        app.run(debug=False, port=port, host=args.host, threaded=True)
     except OSError:
         port = find_free_port()
         print(f"Port {args.port} is in use, trying port {port}")
-        app.run(debug=False, port=port, host=args.host)
+        app.run(debug=False, port=port, host=args.host, threaded=True)